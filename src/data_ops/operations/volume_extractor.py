@@ -4,16 +4,26 @@ Discovers parquet file chunks in an external volume, validates against companion
 .meta files, writes to bronze Delta tables, and archives processed files.
 """
 
+import logging
+import math
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date
+from itertools import islice
+from typing import Any, Literal
 # from datetime import date
 from pydantic import BaseModel, field_validator
-from pyspark.dbutils import DBUtils
+from pyspark import StorageLevel
 from pyspark.sql import DataFrame, SparkSession
+from data_ops.utils.db_helper import get_dbutils
 from data_ops.utils.errors import DataValidationError, ValidationResult
 from data_ops.utils.logging import DatabricksLogger
 from pyspark.sql import functions as F
 
+logger = logging.getLogger(__name__)
+
 
 class VolumeExtractionConfig(BaseModel, frozen=True):
     """Configuration for volume extraction.
@@ -24,6 +34,12 @@ class VolumeExtractionConfig(BaseModel, frozen=True):
         archive_volume_path: Path to the archive volume for processed files
         bronze_schema: Target schema name (default: 'bronze')
         log_table_path: Fully qualified path for the extraction log table
+        max_workers: Maximum number of tables extracted concurrently (default: 8)
+        unique_check_mode: 'exact' counts distinct IDs exactly (requires a shuffle);
+            'approx' uses a HyperLogLog estimate (default: 'exact')
+        unique_tolerance: Allowed relative difference between the expected and
+            estimated unique ID count in 'approx' mode (default: 0.01). A tolerance
+            below 0.003 (including 0) falls back to an exact count.
     """
 
     catalog: str
@@ -31,6 +47,9 @@ class VolumeExtractionConfig(BaseModel, frozen=True):
     archive_volume_path: str
     bronze_schema: str = "bronze"
     log_table_path: str
+    max_workers: int = 8
+    unique_check_mode: Literal["exact", "approx"] = "exact"
+    unique_tolerance: float = 0.01
 
     @field_validator("catalog")
     @classmethod
@@ -47,6 +66,20 @@ class VolumeExtractionConfig(BaseModel, frozen=True):
         # Normalize trailing slash
         return v if v.endswith("/") else v + "/"
 
+    @field_validator("max_workers")
+    @classmethod
+    def max_workers_must_be_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"max_workers must be at least 1, got {v}")
+        return v
+
+    @field_validator("unique_tolerance")
+    @classmethod
+    def unique_tolerance_must_be_fraction(cls, v: float) -> float:
+        if not 0 <= v < 1:
+            raise ValueError(f"unique_tolerance must be in [0, 1), got {v}")
+        return v
+
     def get_table_path(self, table_name: str) -> str:
         """Return the fully qualified table path for a given table name.
 
@@ -59,10 +92,31 @@ class VolumeExtractionConfig(BaseModel, frozen=True):
         return f"{self.catalog}.{self.bronze_schema}.{table_name}"
 
 
-# Chunked files: "claims_20240101_20240331" -> table="claims"
-_CHUNKED_PATTERN = re.compile(r"^(.+?)_(\d{8})_(\d{8})$")
-# Non-chunked files: filename IS the table name (no extension, no date suffix)
-_NON_CHUNKED_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)$")
+# Data files (no extension), matched against the full filename:
+#   Chunked:     "claims_20240101_20240331" -> chunked_table="claims"
+#   Non-chunked: "claims" -> table="claims" (filename IS the table name)
+_TABLE_FILE_PATTERN = re.compile(
+    r"(?P<chunked_table>.+?)_(?P<start>\d{8})_(?P<end>\d{8})"
+    r"|(?P<table>[A-Za-z_][A-Za-z0-9_]*)"
+)
+# Line-by-line form for classifying a newline-joined listing in one finditer pass.
+# The trailing catch-all yields exactly one match per line (groups unset when the
+# name is not a data file) so matches stay aligned with the files they came from.
+_TABLE_FILE_LINES = re.compile(rf"(?m)^(?:{_TABLE_FILE_PATTERN.pattern}|.*)$")
+
+# Maximum number of tables listed individually in the discover_tables log message
+_SUMMARY_MAX_TABLES = 20
+
+# Target size of each Delta file written to bronze
+_TARGET_FILE_BYTES = 256 * 1024 * 1024
+
+# Upper bound on concurrent dbutils.fs.mv calls when archiving a table's files
+_ARCHIVE_MAX_WORKERS = 16
+
+# Smallest rsd passed to approx_count_distinct. HLL++ memory doubles each time rsd
+# drops by ~30% (0.001 is already 2**21 registers per task, and 1e-4 overflows),
+# so tighter estimates use an exact countDistinct instead
+_MIN_APPROX_RSD = 0.001
 
 
 class VolumeExtractor:
@@ -70,7 +124,8 @@ class VolumeExtractor:
 
     Workflow:
         1. Discover data files and group by table name
-        2. For each table: read_meta -> read_and_union_chunks -> validate -> write -> archive
+        2. For each table (concurrently, up to config.max_workers):
+           read_meta -> read_and_union_chunks -> validate -> write -> archive
 
     Args:
         config: Extraction configuration
@@ -90,63 +145,101 @@ class VolumeExtractor:
             process="extract",
             log_table_path=config.log_table_path,
             spark=self.spark,
+            buffered=True,
+            # extract_table runs on pool threads whose stacks never reach the
+            # calling pipeline file, so keep the source detected here
+            capture_source=False,
         )
-        self.dbutils = DBUtils(self.spark)
+        self.dbutils = get_dbutils(self.spark)
+        self._last_listing: list | None = None
+        self._file_sizes: dict[str, int] = {}
 
-    def discover_tables(self) -> dict[str, list[str]]:
+    def discover_tables(self, precomputed_listing: list | None = None) -> dict[str, list[str]]:
         """Discover data files in the source volume and group by table name.
 
         Files follow one of two naming conventions (no extension):
-        - Chunked: tablename_YYYYMM_YYYYMM (e.g., customers_202401_202403)
+        - Chunked: tablename_YYYYMMDD_YYYYMMDD (e.g., customers_20240101_20240331)
         - Non-chunked: tablename (e.g., customers)
         Files with extensions (.meta, etc.) are excluded.
 
+        The raw listing is kept on ``_last_listing`` so a retry can pass it back
+        as ``precomputed_listing`` and skip listing the volume again.
+
+        Args:
+            precomputed_listing: Optional ``dbutils.fs.ls`` result for the source
+                volume. If None, the volume is listed.
+
         Returns:
             Dict mapping table name to list of file paths.
 
         Raises:
             FileNotFoundError: If no data files are found in the source volume.
         """
-        files = self.dbutils.fs.ls(self.config.source_volume_path)
-        tables: dict[str, list[str]] = {}
-
-        for file_info in files:
-            name = file_info.name
-            # Skip files with extensions (.meta, etc.)
-            if "." in name:
+        if precomputed_listing is None:
+            files = self.dbutils.fs.ls(self.config.source_volume_path)
+        else:
+            files = precomputed_listing
+        self._last_listing = files
+        tables: defaultdict[str, list[str]] = defaultdict(list)
+
+        # Skip files with extensions (.meta, etc.), then classify the remaining
+        # names with a single regex scan instead of one match call per file
+        candidates = [file_info for file_info in files if "." not in file_info.name]
+        names = "\n".join(file_info.name for file_info in candidates)
+
+        for file_info, match in zip(candidates, _TABLE_FILE_LINES.finditer(names)):
+            table_name = match["chunked_table"] or match["table"]
+            if table_name is None:
                 continue
-            # Try chunked pattern first (has date range suffix)
-            match = _CHUNKED_PATTERN.match(name)
-            if match:
-                table_name = match.group(1)
-            else:
-                # Non-chunked: entire filename is the table name
-                match = _NON_CHUNKED_PATTERN.match(name)
-                if match:
-                    table_name = match.group(1)
-                else:
-                    continue
-            tables.setdefault(table_name, []).append(file_info.path)
+            tables[table_name].append(file_info.path)
+            self._file_sizes[file_info.path] = file_info.size
 
         if not tables:
             self.logger.failure(
                 step="discover_tables",
                 message=f"No data files found in {self.config.source_volume_path}",
             )
+            self.logger.flush()
             raise FileNotFoundError(f"No data files found in {self.config.source_volume_path}")
 
-        table_summary = ", ".join(f"{name} ({len(paths)} files)" for name, paths in tables.items())
+        shown = islice(tables.items(), _SUMMARY_MAX_TABLES)
+        table_summary = ", ".join(f"{name} ({len(paths)} files)" for name, paths in shown)
+        if len(tables) > _SUMMARY_MAX_TABLES:
+            table_summary += f", ... ({len(tables) - _SUMMARY_MAX_TABLES} more)"
         self.logger.success(
             step="discover_tables",
             message=f"Discovered {len(tables)} tables: {table_summary}",
         )
+        self.logger.flush()
+
+        return dict(tables)
+
+    def _read_meta_local(self, meta_path: str) -> dict[str, str] | None:
+        """Read a meta file from the local Volumes mount without a Spark job.
+
+        Args:
+            meta_path: '/Volumes/...' path of the meta file.
+
+        Returns:
+            Dict mapping test_name to value, or None if the path is not mounted
+            locally or pyarrow is unavailable.
+        """
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            return None
 
-        return tables
+        columns = pq.read_table(meta_path, columns=["test_name", "value"]).to_pydict()
+        return dict(zip(columns["test_name"], columns["value"]))
 
     def read_meta(self, table_name: str) -> dict[str, str]:
         """Read the companion .meta parquet file for a table.
 
-        The meta file is long-form with columns 'test_name' and 'value'.
+        The meta file is long-form with columns 'test_name' and 'value'. When the
+        volume is FUSE-mounted (on a Databricks driver) the file is read directly
+        with pyarrow; otherwise it is read through Spark.
 
         Args:
             table_name: Name of the table to read meta for.
@@ -160,9 +253,11 @@ class VolumeExtractor:
         meta_path = f"{self.config.source_volume_path}{table_name}.meta"
 
         try:
-            meta_df = self.spark.read.parquet(meta_path)
-            rows = meta_df.collect()
-            meta = {row["test_name"]: row["value"] for row in rows}
+            meta = self._read_meta_local(meta_path)
+            if meta is None:
+                meta_df = self.spark.read.parquet(meta_path).select("test_name", "value")
+                # Rows are (test_name, value) tuples, so build the dict positionally
+                meta = dict(meta_df.collect())
         except Exception as e:
             self.logger.failure(
                 step="read_meta",
@@ -179,6 +274,10 @@ class VolumeExtractor:
     def read_and_union_chunks(self, table_name: str, file_paths: list[str]) -> DataFrame:
         """Read and union all parquet chunks for a table.
 
+        Chunks are read through Spark regardless of size: bronze tables are Unity
+        Catalog managed and written by Spark, so a driver-local read would only
+        have to ship the data back to the cluster.
+
         Args:
             table_name: Name of the table being read.
             file_paths: List of file paths to read.
@@ -198,19 +297,60 @@ class VolumeExtractor:
             )
             raise RuntimeError(f"Failed to read parquet chunks for '{table_name}': {e}") from e
 
-        row_count = df.count()
         self.logger.success(
             step="read_chunks",
-            message=(f"Read {len(file_paths)} chunks for '{table_name}': " f"{row_count} rows"),
+            message=f"Read {len(file_paths)} chunks for '{table_name}'",
         )
         return df
 
+    def _aggregate_stats(self, df: DataFrame, meta: dict[str, str]) -> dict[str, Any]:
+        """Compute every aggregate required by the meta checks in one Spark job.
+
+        Args:
+            df: DataFrame to aggregate.
+            meta: Dict of test_name -> value from the meta file.
+
+        Returns:
+            Dict keyed by meta test name ('n_rows', 'n_unique_id', 'max_date',
+            'min_date') for each check present in meta.
+        """
+        aggregations = []
+        if "n_rows" in meta:
+            aggregations.append(F.count(F.lit(1)).alias("n_rows"))
+        if "n_unique_id" in meta:
+            # Keep the estimate's standard error at a third of the tolerance so a
+            # correct table fails the check well under 1% of the time
+            rsd = self.config.unique_tolerance / 3
+            if self.config.unique_check_mode == "approx" and rsd >= _MIN_APPROX_RSD:
+                unique_count = F.approx_count_distinct(meta["id_col"], rsd=rsd)
+            else:
+                unique_count = F.countDistinct(meta["id_col"])
+            aggregations.append(unique_count.alias("n_unique_id"))
+            # Both distinct counts skip NULLs, but NULL IDs count as one distinct
+            # value in the check (as with select(id_col).distinct().count())
+            id_is_null = F.col(meta["id_col"]).isNull().cast("int")
+            aggregations.append(F.max(id_is_null).alias("id_has_null"))
+        if "date_col" in meta:
+            if "max_date" in meta:
+                aggregations.append(F.max(meta["date_col"]).alias("max_date"))
+            if "min_date" in meta:
+                aggregations.append(F.min(meta["date_col"]).alias("min_date"))
+
+        if not aggregations:
+            return {}
+        stats: dict[str, Any] = df.agg(*aggregations).collect()[0].asDict()
+        if "n_unique_id" in stats:
+            stats["n_unique_id"] += stats.pop("id_has_null", None) or 0
+        return stats
+
     def validate(
         self, table_name: str, df: DataFrame, meta: dict[str, str]
     ) -> list[ValidationResult]:
         """Validate a DataFrame against meta expectations.
 
-        Runs ALL checks regardless of individual failures.
+        Runs ALL checks regardless of individual failures. Every aggregate the
+        checks need (row count, unique IDs, min/max date) is computed in a
+        single Spark job rather than one job per check.
 
         Args:
             table_name: Name of the table being validated.
@@ -224,11 +364,12 @@ class VolumeExtractor:
             DataValidationError: If any validation check fails (contains ALL results).
         """
         results: list[ValidationResult] = []
+        stats = self._aggregate_stats(df, meta)
 
         # 1. Row count check
         if "n_rows" in meta:
             expected_rows = int(meta["n_rows"])
-            actual_rows = df.count()
+            actual_rows = stats["n_rows"]
             row_passed = actual_rows == expected_rows
             results.append(
                 ValidationResult(
@@ -269,8 +410,12 @@ class VolumeExtractor:
         if "n_unique_id" in meta:
             id_column = meta["id_col"]
             expected_unique = int(meta["n_unique_id"])
-            actual_unique = df.select(id_column).distinct().count()
-            unique_passed = actual_unique == expected_unique
+            actual_unique = stats["n_unique_id"]
+            if self.config.unique_check_mode == "approx":
+                tolerance = self.config.unique_tolerance
+                unique_passed = abs(actual_unique - expected_unique) <= tolerance * expected_unique
+            else:
+                unique_passed = actual_unique == expected_unique
             results.append(
                 ValidationResult(
                     check_name="validate_unique_id_count",
@@ -295,7 +440,7 @@ class VolumeExtractor:
         if "max_date" in meta and "date_col" in meta:
             date_column = meta["date_col"]
             expected_max = datetime.strptime(meta["max_date"], "%Y-%m-%d")
-            actual_max = df.select(date_column).agg(F.max(date_column)).collect()[0][0]
+            actual_max = stats["max_date"]
             
             # Convert actual_max to datetime for consistent comparison
             if isinstance(actual_max, str):
@@ -328,7 +473,7 @@ class VolumeExtractor:
         if "min_date" in meta and "date_col" in meta:
             date_column = meta["date_col"]
             expected_min = datetime.strptime(meta["min_date"], "%Y-%m-%d")
-            actual_min = df.select(date_column).agg(F.min(date_column)).collect()[0][0]
+            actual_min = stats["min_date"]
             
             # Convert actual_min to datetime for consistent comparison
             if isinstance(actual_min, str):
@@ -367,18 +512,42 @@ class VolumeExtractor:
 
         raise DataValidationError(table_name, results)
 
-    def write_to_bronze(self, table_name: str, df: DataFrame) -> None:
+    def _target_partitions(self, file_paths: list[str]) -> int:
+        """Estimate how many partitions to write so Delta files land near 256MB.
+
+        Uses the file sizes recorded by discover_tables. If any size is unknown,
+        falls back to one partition per four input files.
+
+        Args:
+            file_paths: Data file paths being written.
+
+        Returns:
+            Number of partitions to coalesce to (at least 1).
+        """
+        if all(path in self._file_sizes for path in file_paths):
+            total_bytes = sum(self._file_sizes[path] for path in file_paths)
+            return max(1, math.ceil(total_bytes / _TARGET_FILE_BYTES))
+        return max(1, len(file_paths) // 4)
+
+    def write_to_bronze(
+        self, table_name: str, df: DataFrame, num_partitions: int | None = None
+    ) -> None:
         """Write a validated DataFrame to a bronze Delta table.
 
         Args:
             table_name: Name of the table to write.
             df: DataFrame to write.
+            num_partitions: Optional partition count to coalesce to before
+                writing, to avoid producing many small Delta files.
 
         Raises:
             RuntimeError: If writing fails.
         """
         table_path = self.config.get_table_path(table_name)
 
+        if num_partitions is not None:
+            df = df.coalesce(num_partitions)
+
         try:
             df.write.mode("overwrite").saveAsTable(table_path)
         except Exception as e:
@@ -393,6 +562,22 @@ class VolumeExtractor:
             message=f"Wrote '{table_name}' to {table_path}",
         )
 
+    def _move_file(self, source: str, dest: str) -> Exception | None:
+        """Move a single file, returning the error instead of raising it.
+
+        Args:
+            source: Path of the file to move.
+            dest: Destination path.
+
+        Returns:
+            The exception raised by the move, or None if it succeeded.
+        """
+        try:
+            self.dbutils.fs.mv(source, dest)
+        except Exception as e:
+            return e
+        return None
+
     def archive_files(self, table_name: str, file_paths: list[str]) -> None:
         """Archive processed data files and companion meta file.
 
@@ -407,34 +592,39 @@ class VolumeExtractor:
             file_paths: List of data file paths to archive.
 
         Raises:
-            RuntimeError: If archiving fails.
+            RuntimeError: If any file fails to move. Files that moved
+                successfully are left in the archive volume.
         """
-        today = date.today().strftime("%Y%m%d")
+        suffix = f"_processed{date.today().strftime('%Y%m%d')}"
+        archive_root = self.config.archive_volume_path
+
+        # Data files keep their filename (no extension) with the suffix appended
+        all_moves = [
+            (path, f"{archive_root}{path.rsplit('/', 1)[-1]}{suffix}") for path in file_paths
+        ]
 
         # Include the companion .meta file
         meta_source = f"{self.config.source_volume_path}{table_name}.meta"
-        meta_dest = f"{self.config.archive_volume_path}{table_name}_processed{today}.meta"
-
-        all_moves = []
-
-        for path in file_paths:
-            # Extract filename from path (no extension)
-            filename = path.rsplit("/", 1)[-1]
-            archived_name = f"{filename}_processed{today}"
-            dest = f"{self.config.archive_volume_path}{archived_name}"
-            all_moves.append((path, dest))
-
-        all_moves.append((meta_source, meta_dest))
-
-        try:
-            for source, dest in all_moves:
-                self.dbutils.fs.mv(source, dest)
-        except Exception as e:
-            self.logger.failure(
-                step="archive_files",
-                message=f"Failed to archive files for '{table_name}': {e}",
+        all_moves.append((meta_source, f"{archive_root}{table_name}{suffix}.meta"))
+
+        # Files are moved one by one: the source volume root holds every table's
+        # files, so it can't be renamed as a unit. Each move is an independent REST
+        # call, so overlap them and collect every failure rather than stopping at
+        # the first one
+        sources, dests = zip(*all_moves)
+        workers = min(_ARCHIVE_MAX_WORKERS, len(all_moves))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors = list(executor.map(self._move_file, sources, dests))
+
+        failures = [(source, e) for source, e in zip(sources, errors) if e is not None]
+        if failures:
+            detail = "; ".join(f"{source}: {e}" for source, e in failures)
+            msg = (
+                f"Failed to archive {len(failures)} of {len(all_moves)} files "
+                f"for '{table_name}': {detail}"
             )
-            raise RuntimeError(f"Failed to archive files for '{table_name}': {e}") from e
+            self.logger.failure(step="archive_files", message=msg)
+            raise RuntimeError(msg)
 
         self.logger.success(
             step="archive_files",
@@ -444,15 +634,53 @@ class VolumeExtractor:
             ),
         )
 
+    def _try_persist(self, df: DataFrame) -> bool:
+        """Persist a DataFrame to memory and disk where the compute supports it.
+
+        Serverless compute rejects the caching APIs; there the DataFrame is
+        left as is and simply re-read by each action.
+
+        Args:
+            df: DataFrame to persist.
+
+        Returns:
+            True if the DataFrame was persisted, False otherwise.
+        """
+        try:
+            df.persist(StorageLevel.MEMORY_AND_DISK)
+        except Exception:
+            return False
+        return True
+
     def extract_table(self, table_name: str, file_paths: list[str]) -> None:
         """Orchestrate extraction for a single table.
 
         Steps: read_meta -> read_and_union_chunks -> validate -> write_to_bronze -> archive_files
 
+        Validation deliberately runs before the write, so a drop that fails its
+        checks never replaces the current bronze table. The chunks are read once:
+        validate's single aggregation populates the persisted DataFrame that the
+        write then reuses.
+
+        Log entries for the table are buffered and written in one append when
+        extraction finishes, whether it succeeds or fails. A failed log write is
+        reported as a warning (the entries stay buffered for the next flush) so
+        it never replaces the table's own outcome or error.
+
         Args:
             table_name: Name of the table to extract.
             file_paths: List of file paths for this table.
         """
+        try:
+            self._extract_table(table_name, file_paths)
+        finally:
+            try:
+                self.logger.flush()
+            except RuntimeError as e:
+                logger.warning("Could not write extraction logs for '%s': %s", table_name, e)
+
+    def _extract_table(self, table_name: str, file_paths: list[str]) -> None:
+        """Run the extraction steps for a single table (see extract_table)."""
         self.logger.log(
             step="extract_table",
             status="success",
@@ -461,8 +689,16 @@ class VolumeExtractor:
 
         meta = self.read_meta(table_name)
         df = self.read_and_union_chunks(table_name, file_paths)
-        self.validate(table_name, df, meta)
-        self.write_to_bronze(table_name, df)
+
+        # Cache the chunks scanned by validate so write_to_bronze doesn't re-read them
+        persisted = self._try_persist(df)
+        try:
+            self.validate(table_name, df, meta)
+            self.write_to_bronze(table_name, df, self._target_partitions(file_paths))
+        finally:
+            if persisted:
+                df.unpersist()
+
         self.archive_files(table_name, file_paths)
 
         self.logger.success(
@@ -474,34 +710,46 @@ class VolumeExtractor:
         """Extract the specified tables from the source volume.
 
         Discovers available files then processes only the requested tables.
-        Continues processing remaining tables if one fails. Tables not found
-        in the source volume are recorded as failures.
+        Tables are extracted concurrently (up to ``config.max_workers`` at a
+        time) so their Spark jobs and file operations overlap. Continues
+        processing remaining tables if one fails. Tables not found in the
+        source volume are recorded as failures.
 
         Args:
             tables: Table names to extract.
 
         Returns:
-            Dict mapping table_name to 'success' or an error message.
+            Dict mapping table_name to 'success' or an error message, in the
+            order the tables were requested.
         """
         discovered = self.discover_tables()
         results: dict[str, str] = {}
+        requested = list(dict.fromkeys(tables))
+
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            futures = {}
+            for table_name in requested:
+                if table_name not in discovered:
+                    msg = f"Table '{table_name}' not found in {self.config.source_volume_path}"
+                    results[table_name] = msg
+                    self.logger.failure(step="extract", message=msg)
+                    continue
+                future = executor.submit(self.extract_table, table_name, discovered[table_name])
+                futures[future] = table_name
+
+            for future in as_completed(futures):
+                table_name = futures[future]
+                error = future.exception()
+                if error is None:
+                    results[table_name] = "success"
+                else:
+                    results[table_name] = str(error)
+                    self.logger.failure(
+                        step="extract",
+                        message=f"Failed to extract '{table_name}': {error}",
+                    )
 
-        for table_name in tables:
-            if table_name not in discovered:
-                msg = f"Table '{table_name}' not found in {self.config.source_volume_path}"
-                results[table_name] = msg
-                self.logger.failure(step="extract", message=msg)
-                continue
-
-            try:
-                self.extract_table(table_name, discovered[table_name])
-                results[table_name] = "success"
-            except Exception as e:
-                results[table_name] = str(e)
-                self.logger.failure(
-                    step="extract",
-                    message=f"Failed to extract '{table_name}': {e}",
-                )
+        results = {table_name: results[table_name] for table_name in requested}
 
         succeeded = sum(1 for v in results.values() if v == "success")
         failed = len(results) - succeeded
@@ -513,5 +761,6 @@ class VolumeExtractor:
                 f"out of {len(results)} tables"
             ),
         )
+        self.logger.flush()
 
         return results
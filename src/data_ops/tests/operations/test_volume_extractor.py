@@ -1,14 +1,18 @@
 """Unit tests for VolumeExtractionConfig and VolumeExtractor."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+from pyspark.sql import Row
+
 from data_ops.operations.volume_extractor import (
     VolumeExtractionConfig,
     VolumeExtractor,
-    _CHUNKED_PATTERN,
-    _NON_CHUNKED_PATTERN,
+    _TABLE_FILE_LINES,
+    _TABLE_FILE_PATTERN,
 )
 from data_ops.utils.errors import DataValidationError
 
@@ -26,47 +30,35 @@ def _make_extractor():
     ext.spark = MagicMock()
     ext.logger = MagicMock()
     ext.dbutils = MagicMock()
+    ext._last_listing = None
+    ext._file_sizes = {}
     return ext
 
 
-def _make_df(rows=1000, cols=15, unique=500, min_date=None, max_date=None):
-    """Create a mocked DataFrame with configurable return values.
-    
+def _make_df(rows=1000, cols=15, unique=500, min_date=None, max_date=None, id_has_null=0):
+    """Create a mocked DataFrame whose single agg() returns the given stats.
+
     Args:
-        rows: Number of rows for count()
+        rows: Row count returned for the 'n_rows' aggregate
         cols: Number of columns
-        unique: Number of unique values for distinct().count()
-        min_date: Optional datetime for min date aggregation
-        max_date: Optional datetime for max date aggregation
-    
+        unique: Distinct ID count returned for the 'n_unique_id' aggregate
+        min_date: Optional datetime returned for the 'min_date' aggregate
+        max_date: Optional datetime returned for the 'max_date' aggregate
+        id_has_null: 1 if the ID column contains a NULL, else 0
+
     Returns:
         MagicMock configured to simulate a DataFrame
     """
     df = MagicMock()
-    df.count.return_value = rows
     df.columns = [f"c{i}" for i in range(cols)]
-    df.select.return_value.distinct.return_value.count.return_value = unique
-    
-    # Configure date aggregation if dates provided
-    if min_date or max_date:
-        date_col_mock = MagicMock()
-        agg_results = []
-        
-        # Build side_effect list for sequential agg().collect() calls
-        if max_date:
-            max_result = MagicMock()
-            max_result.__getitem__.return_value.__getitem__.return_value = max_date
-            agg_results.append([max_result])
-        
-        if min_date:
-            min_result = MagicMock()
-            min_result.__getitem__.return_value.__getitem__.return_value = min_date
-            agg_results.append([min_result])
-        
-        if agg_results:
-            date_col_mock.agg.return_value.collect.side_effect = agg_results
-            df.select.return_value = date_col_mock
-    
+    stats = Row(
+        n_rows=rows,
+        n_unique_id=unique,
+        min_date=min_date,
+        max_date=max_date,
+        id_has_null=id_has_null,
+    )
+    df.agg.return_value.collect.return_value = [stats]
     return df
 
 
@@ -100,6 +92,17 @@ class TestVolumeExtractionConfig(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     VolumeExtractionConfig(**kwargs)
 
+    def test_max_workers(self):
+        self.assertEqual(VolumeExtractionConfig(**BASE_CFG).max_workers, 8)
+        with self.assertRaises(ValueError):
+            VolumeExtractionConfig(**{**BASE_CFG, "max_workers": 0})
+
+    def test_unique_tolerance_range(self):
+        for tolerance in [-0.1, 1.0]:
+            with self.subTest(tolerance=tolerance):
+                with self.assertRaises(ValueError):
+                    VolumeExtractionConfig(**{**BASE_CFG, "unique_tolerance": tolerance})
+
     def test_immutability(self):
         cfg = VolumeExtractionConfig(**BASE_CFG)
         with self.assertRaises(Exception):
@@ -115,27 +118,40 @@ class TestFilePatterns(unittest.TestCase):
         ]
         for filename, expected_table, start, end in cases:
             with self.subTest(filename=filename):
-                m = _CHUNKED_PATTERN.match(filename)
+                m = _TABLE_FILE_PATTERN.fullmatch(filename)
                 self.assertIsNotNone(m)
-                self.assertEqual(m.group(1), expected_table)
-                self.assertEqual(m.group(2), start)
-                self.assertEqual(m.group(3), end)
+                self.assertEqual(m["chunked_table"], expected_table)
+                self.assertEqual(m["start"], start)
+                self.assertEqual(m["end"], end)
+                self.assertIsNone(m["table"])
 
     def test_non_chunked_pattern(self):
         for name, expected in [("test__ess", "test__ess"), ("test__dxcg", "test__dxcg")]:
             with self.subTest(name=name):
-                m = _NON_CHUNKED_PATTERN.match(name)
+                m = _TABLE_FILE_PATTERN.fullmatch(name)
                 self.assertIsNotNone(m)
-                self.assertEqual(m.group(1), expected)
+                self.assertIsNone(m["chunked_table"])
+                self.assertEqual(m["table"], expected)
 
     def test_chunked_rejects_invalid_dates(self):
-        # 6-digit dates (old YYYYMM format) should not match
-        self.assertIsNone(_CHUNKED_PATTERN.match("test__ess_202401_202403"))
+        # 6-digit dates (old YYYYMM format) are not a chunk suffix
+        m = _TABLE_FILE_PATTERN.fullmatch("test__ess_202401_202403")
+        self.assertIsNone(m["chunked_table"])
+        self.assertEqual(m["table"], "test__ess_202401_202403")
 
-    def test_non_chunked_rejects_extensions(self):
+    def test_rejects_extensions(self):
         for name in ["test__ess.meta", "README.md"]:
             with self.subTest(name=name):
-                self.assertIsNone(_NON_CHUNKED_PATTERN.match(name))
+                self.assertIsNone(_TABLE_FILE_PATTERN.fullmatch(name))
+
+    def test_line_pattern_yields_one_match_per_name(self):
+        names = ["test__ess_20240101_20240331", "bad-name", "test__dxcg", "x_20240101_20240331"]
+        matches = list(_TABLE_FILE_LINES.finditer("\n".join(names)))
+        self.assertEqual(len(matches), len(names))
+        self.assertEqual(
+            [m["chunked_table"] or m["table"] for m in matches],
+            ["test__ess", None, "test__dxcg", "x"],
+        )
 
 
 class TestDiscoverTables(unittest.TestCase):
@@ -145,10 +161,10 @@ class TestDiscoverTables(unittest.TestCase):
 
     def test_groups_chunked_files_and_skips_meta(self):
         self.ext.dbutils.fs.ls.return_value = [
-            SimpleNamespace(name="test__ess_20240101_20240331", path="p1"),
-            SimpleNamespace(name="test__ess_20240401_20240630", path="p2"),
-            SimpleNamespace(name="test__dxcg_20240101_20240331", path="p3"),
-            SimpleNamespace(name="test__ess.meta", path="ignored"),
+            SimpleNamespace(name="test__ess_20240101_20240331", path="p1", size=1),
+            SimpleNamespace(name="test__ess_20240401_20240630", path="p2", size=1),
+            SimpleNamespace(name="test__dxcg_20240101_20240331", path="p3", size=1),
+            SimpleNamespace(name="test__ess.meta", path="ignored", size=1),
         ]
         tables = self.ext.discover_tables()
         self.assertEqual(len(tables["test__ess"]), 2)
@@ -156,29 +172,56 @@ class TestDiscoverTables(unittest.TestCase):
 
     def test_groups_non_chunked_files(self):
         self.ext.dbutils.fs.ls.return_value = [
-            SimpleNamespace(name="test__eligibility", path="p1"),
-            SimpleNamespace(name="test__eligibility.meta", path="ignored"),
+            SimpleNamespace(name="test__eligibility", path="p1", size=1),
+            SimpleNamespace(name="test__eligibility.meta", path="ignored", size=1),
         ]
         tables = self.ext.discover_tables()
         self.assertEqual(tables, {"test__eligibility": ["p1"]})
 
     def test_mixed_chunked_and_non_chunked(self):
         self.ext.dbutils.fs.ls.return_value = [
-            SimpleNamespace(name="test__member_20240101_20240331", path="p1"),
-            SimpleNamespace(name="test__member_20240401_20240630", path="p2"),
-            SimpleNamespace(name="test__claims_20240101_20240331", path="p3"),
-            SimpleNamespace(name="test__eligibility", path="p4"),
-            SimpleNamespace(name="test__member.meta", path="ignored"),
-            SimpleNamespace(name="test__claims.meta", path="ignored"),
-            SimpleNamespace(name="test__eligibility.meta", path="ignored"),
+            SimpleNamespace(name="test__member_20240101_20240331", path="p1", size=1),
+            SimpleNamespace(name="test__member_20240401_20240630", path="p2", size=1),
+            SimpleNamespace(name="test__claims_20240101_20240331", path="p3", size=1),
+            SimpleNamespace(name="test__eligibility", path="p4", size=1),
+            SimpleNamespace(name="test__member.meta", path="ignored", size=1),
+            SimpleNamespace(name="test__claims.meta", path="ignored", size=1),
+            SimpleNamespace(name="test__eligibility.meta", path="ignored", size=1),
         ]
         tables = self.ext.discover_tables()
         self.assertEqual(len(tables["test__member"]), 2)
         self.assertEqual(len(tables["test__claims"]), 1)
         self.assertEqual(len(tables["test__eligibility"]), 1)
 
+    def test_precomputed_listing_skips_ls(self):
+        listing = [SimpleNamespace(name="test__eligibility", path="p1", size=1)]
+        tables = self.ext.discover_tables(precomputed_listing=listing)
+        self.assertEqual(tables, {"test__eligibility": ["p1"]})
+        self.ext.dbutils.fs.ls.assert_not_called()
+        self.assertIs(self.ext._last_listing, listing)
+
+    def test_summary_truncated_for_many_tables(self):
+        self.ext.dbutils.fs.ls.return_value = [
+            SimpleNamespace(name=f"test__t{i}", path=f"p{i}", size=1) for i in range(25)
+        ]
+        self.ext.discover_tables()
+        message = self.ext.logger.success.call_args.kwargs["message"]
+        self.assertIn("Discovered 25 tables", message)
+        self.assertIn("test__t19 (1 files)", message)
+        self.assertNotIn("test__t20 ", message)
+        self.assertIn("... (5 more)", message)
+
+    def test_skips_unrecognized_names_between_valid_files(self):
+        self.ext.dbutils.fs.ls.return_value = [
+            SimpleNamespace(name="test__a_20240101_20240331", path="p1", size=1),
+            SimpleNamespace(name="not-a-table", path="p2", size=1),
+            SimpleNamespace(name="test__b", path="p3", size=1),
+        ]
+        tables = self.ext.discover_tables()
+        self.assertEqual(tables, {"test__a": ["p1"], "test__b": ["p3"]})
+
     def test_empty_or_meta_only_raises(self):
-        for files in [[], [SimpleNamespace(name="x.meta", path="p")]]:
+        for files in [[], [SimpleNamespace(name="x.meta", path="p", size=1)]]:
             with self.subTest(files=files):
                 self.ext.dbutils.fs.ls.return_value = files
                 with self.assertRaises(FileNotFoundError):
@@ -191,24 +234,47 @@ class TestReadMeta(unittest.TestCase):
         self.ext = _make_extractor()
 
     def test_successful_read(self):
-        rows = [MagicMock(), MagicMock()]
-        rows[0].__getitem__ = lambda s, k: {"test_name": "number_of_rows", "value": "1000"}[k]
-        rows[1].__getitem__ = lambda s, k: {"test_name": "number_of_columns", "value": "15"}[k]
-        self.ext.spark.read.parquet.return_value.collect.return_value = rows
+        rows = [
+            Row(test_name="number_of_rows", value="1000"),
+            Row(test_name="number_of_columns", value="15"),
+        ]
+        meta_df = self.ext.spark.read.parquet.return_value.select.return_value
+        meta_df.collect.return_value = rows
 
         meta = self.ext.read_meta("test__ess")
         self.assertEqual(meta, {"number_of_rows": "1000", "number_of_columns": "15"})
+        read_parquet = self.ext.spark.read.parquet.return_value
+        read_parquet.select.assert_called_once_with("test_name", "value")
 
     def test_missing_meta_raises(self):
         self.ext.spark.read.parquet.side_effect = Exception("not found")
         with self.assertRaises(FileNotFoundError):
             self.ext.read_meta("test__ess")
 
+    @patch("data_ops.operations.volume_extractor.os.path.exists", return_value=True)
+    def test_mounted_volume_read_with_pyarrow(self, _mock_exists):
+        pyarrow = MagicMock()
+        pyarrow.parquet.read_table.return_value.to_pydict.return_value = {
+            "test_name": ["number_of_rows", "number_of_columns"],
+            "value": ["1000", "15"],
+        }
+        with patch.dict("sys.modules", {"pyarrow": pyarrow, "pyarrow.parquet": pyarrow.parquet}):
+            meta = self.ext.read_meta("test__ess")
+
+        self.assertEqual(meta, {"number_of_rows": "1000", "number_of_columns": "15"})
+        pyarrow.parquet.read_table.assert_called_once_with(
+            "/Volumes/dev/bronze/external/mft/test__ess.meta", columns=["test_name", "value"]
+        )
+        self.ext.spark.read.parquet.assert_not_called()
+
 
 class TestValidation(unittest.TestCase):
 
     def setUp(self):
         self.ext = _make_extractor()
+        patcher = patch("data_ops.operations.volume_extractor.F")
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_all_pass(self):
         results = self.ext.validate("test__t", _make_df(), META)
@@ -233,6 +299,56 @@ class TestValidation(unittest.TestCase):
             with self.subTest(step=s):
                 self.assertIn(s, steps)
 
+    def test_approx_unique_check(self):
+        self.ext.config = VolumeExtractionConfig(**{**BASE_CFG, "unique_check_mode": "approx"})
+        cases = [("within_tolerance", 503, True), ("outside_tolerance", 520, False)]
+        for label, unique, passed in cases:
+            with self.subTest(label=label):
+                df = _make_df(unique=unique)
+                if passed:
+                    results = self.ext.validate("test__t", df, META)
+                else:
+                    with self.assertRaises(DataValidationError) as ctx:
+                        self.ext.validate("test__t", df, META)
+                    results = ctx.exception.results
+                unique_result = next(
+                    r for r in results if r.check_name == "validate_unique_id_count"
+                )
+                self.assertEqual(unique_result.passed, passed)
+
+    def test_approx_estimate_error_follows_tolerance(self):
+        cases = [
+            (0.03, "approx_count_distinct", 0.01),
+            (0.003, "approx_count_distinct", 0.001),
+            (0.0029, "countDistinct", None),
+            (1e-4, "countDistinct", None),
+            (0.0, "countDistinct", None),
+        ]
+        for tolerance, expected_fn, expected_rsd in cases:
+            with self.subTest(tolerance=tolerance):
+                self.ext.config = VolumeExtractionConfig(
+                    **{**BASE_CFG, "unique_check_mode": "approx", "unique_tolerance": tolerance}
+                )
+                with patch("data_ops.operations.volume_extractor.F") as mock_f:
+                    self.ext.validate("test__t", _make_df(), META)
+                getattr(mock_f, expected_fn).assert_called_once()
+                if expected_rsd is not None:
+                    rsd = mock_f.approx_count_distinct.call_args.kwargs["rsd"]
+                    self.assertAlmostEqual(rsd, expected_rsd)
+
+    def test_null_id_counts_as_distinct_value(self):
+        # 499 non-null IDs plus NULL make the 500 distinct values META expects
+        results = self.ext.validate("test__t", _make_df(unique=499, id_has_null=1), META)
+        unique_result = next(r for r in results if r.check_name == "validate_unique_id_count")
+        self.assertEqual(unique_result.actual, 500)
+
+    def test_single_aggregation_job(self):
+        df = _make_df()
+        self.ext.validate("test__t", df, META)
+        df.agg.assert_called_once()
+        df.count.assert_not_called()
+        df.select.assert_not_called()
+
     def test_min_max_date_validation(self):
         """Test that min and max date checks fail when DataFrame dates don't match metadata."""
         ext = _make_extractor()
@@ -273,6 +389,28 @@ class TestWriteToBronze(unittest.TestCase):
         df.write.mode.assert_called_with("overwrite")
         df.write.mode.return_value.saveAsTable.assert_called_with("dev.bronze.test_claims_")
 
+    def test_coalesces_when_partitions_given(self):
+        ext = _make_extractor()
+        df = MagicMock()
+        ext.write_to_bronze("test_claims_", df, num_partitions=3)
+        df.coalesce.assert_called_once_with(3)
+        df.coalesce.return_value.write.mode.return_value.saveAsTable.assert_called_with(
+            "dev.bronze.test_claims_"
+        )
+
+    def test_target_partitions(self):
+        ext = _make_extractor()
+        mb = 1024 * 1024
+        ext._file_sizes = {"p1": 300 * mb, "p2": 300 * mb, "p3": 10 * mb}
+        cases = [
+            ("sized", ["p1", "p2"], 3),
+            ("small", ["p3"], 1),
+            ("unknown_sizes", [f"x{i}" for i in range(9)], 2),
+        ]
+        for label, paths, expected in cases:
+            with self.subTest(label=label):
+                self.assertEqual(ext._target_partitions(paths), expected)
+
     def test_failure_raises(self):
         ext = _make_extractor()
         df = MagicMock()
@@ -308,22 +446,100 @@ class TestArchiveFiles(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             ext.archive_files("test__t", ["/Volumes/dev/bronze/external/mft/test__t_20240101_20240331"])
 
+    @patch("data_ops.operations.volume_extractor.date")
+    def test_partial_failure_attempts_every_move(self, mock_date):
+        mock_date.today.return_value.strftime.return_value = "20260210"
+        ext = _make_extractor()
+        paths = [
+            "/Volumes/dev/bronze/external/mft/test__t_20240101_20240331",
+            "/Volumes/dev/bronze/external/mft/test__t_20240401_20240630",
+        ]
+
+        def deny_first(src, dst):
+            if src == paths[0]:
+                raise Exception("denied")
+
+        ext.dbutils.fs.mv.side_effect = deny_first
+        with self.assertRaises(RuntimeError) as ctx:
+            ext.archive_files("test__t", paths)
+        self.assertEqual(ext.dbutils.fs.mv.call_count, 3)
+        self.assertIn("1 of 3", str(ctx.exception))
+        self.assertIn(paths[0], str(ctx.exception))
+
+
+class TestExtractTable(unittest.TestCase):
+
+    def setUp(self):
+        self.ext = _make_extractor()
+        self.df = MagicMock()
+        self.ext.read_meta = MagicMock(return_value=META)
+        self.ext.read_and_union_chunks = MagicMock(return_value=self.df)
+        self.ext.validate = MagicMock()
+        self.ext.write_to_bronze = MagicMock()
+        self.ext.archive_files = MagicMock()
+
+    def test_persists_between_validate_and_write(self):
+        self.ext.extract_table("test__a", ["p1"])
+        self.df.persist.assert_called_once()
+        self.df.unpersist.assert_called_once()
+        self.ext.write_to_bronze.assert_called_once_with("test__a", self.df, 1)
+        self.ext.archive_files.assert_called_once_with("test__a", ["p1"])
+
+    def test_unpersists_on_validation_failure(self):
+        self.ext.validate.side_effect = DataValidationError("test__a", [])
+        with self.assertRaises(DataValidationError):
+            self.ext.extract_table("test__a", ["p1"])
+        self.df.unpersist.assert_called_once()
+        self.ext.archive_files.assert_not_called()
+
+    def test_flushes_logs_on_success_and_failure(self):
+        self.ext.extract_table("test__a", ["p1"])
+        self.ext.logger.flush.assert_called_once()
+
+        self.ext.logger.reset_mock()
+        self.ext.read_meta.side_effect = FileNotFoundError("missing")
+        with self.assertRaises(FileNotFoundError):
+            self.ext.extract_table("test__a", ["p1"])
+        self.ext.logger.flush.assert_called_once()
+
+    def test_log_flush_failure_keeps_original_error(self):
+        self.ext.logger.flush.side_effect = RuntimeError("Failed to write log to Delta table")
+        self.ext.validate.side_effect = DataValidationError("test__a", [])
+        with self.assertLogs("data_ops.operations.volume_extractor", level="WARNING"):
+            with self.assertRaises(DataValidationError):
+                self.ext.extract_table("test__a", ["p1"])
+
+    def test_persist_unsupported_falls_back(self):
+        self.df.persist.side_effect = Exception("NOT_SUPPORTED_WITH_SERVERLESS")
+        self.ext.extract_table("test__a", ["p1"])
+        self.df.unpersist.assert_not_called()
+        self.ext.write_to_bronze.assert_called_once_with("test__a", self.df, 1)
+
 
 class TestExtract(unittest.TestCase):
 
     def setUp(self):
         self.ext = _make_extractor()
         self.ext.dbutils.fs.ls.return_value = [
-            SimpleNamespace(name="test__a_20240101_20240331", path="p1"),
-            SimpleNamespace(name="test__b_20240101_20240331", path="p2"),
+            SimpleNamespace(name="test__a_20240101_20240331", path="p1", size=1),
+            SimpleNamespace(name="test__b_20240101_20240331", path="p2", size=1),
         ]
 
     def test_continues_on_failure(self):
-        self.ext.extract_table = MagicMock(side_effect=[RuntimeError("fail"), None])
+        def fail_a(table_name, file_paths):
+            if table_name == "test__a":
+                raise RuntimeError("fail")
+
+        self.ext.extract_table = MagicMock(side_effect=fail_a)
         results = self.ext.extract(["test__a", "test__b"])
         self.assertIn("fail", results["test__a"])
         self.assertEqual(results["test__b"], "success")
 
+    def test_results_follow_requested_order(self):
+        self.ext.extract_table = MagicMock()
+        results = self.ext.extract(["test__b", "test__missing", "test__a"])
+        self.assertEqual(list(results), ["test__b", "test__missing", "test__a"])
+
     def test_table_not_found_recorded_as_failure(self):
         self.ext.extract_table = MagicMock()
         results = self.ext.extract(["test__a", "test__missing"])
@@ -337,5 +553,19 @@ class TestExtract(unittest.TestCase):
         call_args = self.ext.extract_table.call_args
         self.assertEqual(call_args[0][0], "test__a")
 
+    @patch("data_ops.operations.volume_extractor.get_dbutils")
+    def test_pool_worker_logs_keep_caller_source(self, mock_get_dbutils):
+        # Installed as a wheel, the extractor's own frames are skipped like any
+        # other site-packages frame; a pool worker's stack holds nothing else
+        skip = ("site-packages", "lib/python", "importlib", "runpy", "operations/volume_")
+        with patch("data_ops.utils.logging._SKIP_SUBSTRINGS", skip):
+            ext = VolumeExtractor(VolumeExtractionConfig(**BASE_CFG), MagicMock())
+            self.addCleanup(ext.logger._pending.clear)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(ext.logger.success, "write", "done").result()
+        source = ext.logger._pending[0][6]
+        self.assertEqual(source, ext.logger._source)
+        self.assertTrue(source.endswith("test_volume_extractor.py"))
+
 if __name__ == "__main__":
     unittest.main(argv=[''], exit=False, verbosity=2)
@@ -0,0 +1,163 @@
+"""Unit tests for Databricks environment helpers."""
+
+import gc
+import os
+import sys
+import unittest
+import weakref
+from unittest.mock import MagicMock, patch
+
+from pyspark.sql import Row
+
+from data_ops.utils import db_helper
+from data_ops.utils.db_helper import get_catalog, get_dbutils, get_spark, run_with_retry
+
+
+@patch("data_ops.utils.db_helper.SparkSession")
+class TestGetSpark(unittest.TestCase):
+
+    def setUp(self):
+        db_helper._SPARK = None
+        self.addCleanup(setattr, db_helper, "_SPARK", None)
+
+    def test_reuses_live_session(self, mock_session_cls):
+        session = mock_session_cls.builder.getOrCreate.return_value
+        session.is_stopped = False
+        self.assertIs(get_spark(), session)
+        self.assertIs(get_spark(), session)
+        mock_session_cls.builder.getOrCreate.assert_called_once()
+        mock_session_cls.getActiveSession.assert_not_called()
+
+    def test_recreates_after_stop(self, mock_session_cls):
+        stopped, fresh = MagicMock(is_stopped=False), MagicMock(is_stopped=False)
+        mock_session_cls.builder.getOrCreate.side_effect = [stopped, fresh]
+        self.assertIs(get_spark(), stopped)
+        stopped.is_stopped = True
+        self.assertIs(get_spark(), fresh)
+
+    def test_classic_session_stopped_when_context_gone(self, mock_session_cls):
+        stopped, fresh = MagicMock(spec=["_sc"]), MagicMock(spec=["_sc"])
+        mock_session_cls.builder.getOrCreate.side_effect = [stopped, fresh]
+        self.assertIs(get_spark(), stopped)
+        self.assertIs(get_spark(), stopped)
+        stopped._sc._jsc = None
+        self.assertIs(get_spark(), fresh)
+
+
+class TestGetCatalog(unittest.TestCase):
+
+    def setUp(self):
+        get_catalog.cache_clear()
+        patcher = patch("data_ops.utils.db_helper.F")
+        self.mock_f = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_spark = MagicMock()
+        self.catalogs = self.mock_spark.sql.return_value.filter.return_value.select.return_value
+
+    def test_returns_first_match(self):
+        self.catalogs.first.return_value = Row(catalog="dev_cda_ds")
+        self.assertEqual(get_catalog(self.mock_spark, "cda_ds"), "dev_cda_ds")
+        self.mock_spark.sql.assert_called_once_with("SHOW CATALOGS LIKE '*cda_ds*'")
+        self.mock_f.col.return_value.contains.assert_called_once_with("cda_ds")
+
+    def test_no_match_raises_lookup_error(self):
+        self.catalogs.first.return_value = None
+        with self.assertRaises(LookupError):
+            get_catalog(self.mock_spark, "missing")
+
+    def test_result_cached_per_match_str(self):
+        self.catalogs.first.return_value = Row(catalog="dev_cda_ds")
+        get_catalog(self.mock_spark, "cda_ds")
+        get_catalog(self.mock_spark, "cda_ds")
+        get_catalog(self.mock_spark, "dev")
+        self.assertEqual(self.mock_spark.sql.call_count, 2)
+
+    def test_cache_disabled_by_env(self):
+        self.catalogs.first.return_value = Row(catalog="dev_cda_ds")
+        with patch.dict(os.environ, {"DATA_OPS_DISABLE_CATALOG_CACHE": "1"}):
+            get_catalog(self.mock_spark, "cda_ds")
+            get_catalog(self.mock_spark, "cda_ds")
+        self.assertEqual(self.mock_spark.sql.call_count, 2)
+
+    def test_lookup_failure_not_cached(self):
+        self.catalogs.first.side_effect = [None, Row(catalog="dev_cda_ds")]
+        with self.assertRaises(LookupError):
+            get_catalog(self.mock_spark, "cda_ds")
+        self.assertEqual(get_catalog(self.mock_spark, "cda_ds"), "dev_cda_ds")
+
+    def test_cache_does_not_keep_session_alive(self):
+        spark = MagicMock()
+        catalogs = spark.sql.return_value.filter.return_value.select.return_value
+        catalogs.first.return_value = Row(catalog="dev_cda_ds")
+        get_catalog(spark, "cda_ds")
+        # The mocked query chain holds no reference back to the session
+        spark.reset_mock()
+        ref = weakref.ref(spark)
+        del spark, catalogs
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_invalid_match_str_rejected(self):
+        for match_str in ["", "dev' OR '1'='1", "dev*", "dev cat"]:
+            with self.subTest(match_str=match_str):
+                with self.assertRaises(ValueError):
+                    get_catalog(self.mock_spark, match_str)
+        self.mock_spark.sql.assert_not_called()
+
+
+class TestGetDbutils(unittest.TestCase):
+
+    def setUp(self):
+        # pyspark.dbutils only exists on the Databricks runtime. A plain class, since a
+        # mock would keep the session alive through its recorded call args
+        self.created = []
+        created = self.created
+
+        class DBUtils:
+            def __init__(self, spark):
+                created.append(self)
+
+        module = MagicMock(DBUtils=DBUtils)
+        patcher = patch.dict(sys.modules, {"pyspark.dbutils": module})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cached_per_session(self):
+        spark, other = MagicMock(), MagicMock()
+        self.assertIs(get_dbutils(spark), get_dbutils(spark))
+        get_dbutils(other)
+        self.assertEqual(len(self.created), 2)
+
+    def test_cache_does_not_keep_session_alive(self):
+        spark = MagicMock()
+        get_dbutils(spark)
+        ref = weakref.ref(spark)
+        del spark
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+@patch("data_ops.utils.db_helper.time.sleep")
+@patch("data_ops.utils.db_helper.get_dbutils")
+class TestRunWithRetry(unittest.TestCase):
+
+    def test_retries_with_backoff_then_succeeds(self, mock_get_dbutils, mock_sleep):
+        run = mock_get_dbutils.return_value.notebook.run
+        run.side_effect = [Exception("e1"), Exception("e2"), "done"]
+        with self.assertLogs("data_ops.utils.db_helper", level="WARNING") as logs:
+            result = run_with_retry(MagicMock(), "nb", timeout=60)
+        self.assertEqual(result, "done")
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1, 2])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_reraises_after_max_retries(self, mock_get_dbutils, mock_sleep):
+        mock_get_dbutils.return_value.notebook.run.side_effect = Exception("boom")
+        with self.assertLogs("data_ops.utils.db_helper", level="WARNING"):
+            with self.assertRaises(Exception):
+                run_with_retry(MagicMock(), "nb", timeout=60, max_retries=2)
+        self.assertEqual(mock_get_dbutils.return_value.notebook.run.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
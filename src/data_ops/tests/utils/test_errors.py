@@ -4,6 +4,14 @@ import unittest
 
 from data_ops.utils.errors import DataValidationError, ValidationResult
 
+_EXPECTED_FRAGMENTS = (
+    ("header", "Validation failed for table 'customers'"),
+    ("failure_count", "1 of 3 checks failed"),
+    ("pass_marker", "[PASS] row_count:"),
+    ("fail_marker", "[FAIL] column_count:"),
+    ("pass_marker_2", "[PASS] unique_id_count:"),
+)
+
 
 class TestValidationResult(unittest.TestCase):
     """Test cases for ValidationResult dataclass."""
@@ -30,32 +38,35 @@ class TestValidationResult(unittest.TestCase):
         for case in test_cases:
             with self.subTest(check_name=case["check_name"], passed=case["passed"]):
                 result = ValidationResult(**case)
-                self.assertEqual(result.check_name, case["check_name"])
-                self.assertEqual(result.expected, case["expected"])
-                self.assertEqual(result.actual, case["actual"])
-                self.assertEqual(result.passed, case["passed"])
-                self.assertEqual(result.message, case["message"])
+                self.assertEqual({field: getattr(result, field) for field in case}, case)
+
+    def test_immutable(self):
+        """Test that results cannot be modified after creation."""
+        result = ValidationResult("row_count", 1000, 900, False, "Expected 1000 rows, got 900")
+        with self.assertRaises(AttributeError):
+            result.passed = True  # type: ignore[misc]
 
 
 class TestDataValidationError(unittest.TestCase):
     """Test cases for DataValidationError exception."""
 
-    def setUp(self):
-        """Set up common test data."""
-        self.results = [
+    @classmethod
+    def setUpClass(cls):
+        """Set up common test data shared by every test."""
+        cls.results = (
             ValidationResult("row_count", 1000, 1000, True, "Expected 1000 rows, got 1000"),
             ValidationResult("column_count", 15, 12, False, "Expected 15 columns, got 12"),
             ValidationResult("unique_id_count", 500, 500, True, "Expected 500 unique values, got 500"),
-        ]
+        )
 
     def test_is_exception(self):
         """Test that DataValidationError is an Exception subclass."""
-        error = DataValidationError("customers", self.results)
+        error = DataValidationError("customers", list(self.results))
         self.assertIsInstance(error, Exception)
 
     def test_table_name_stored(self):
         """Test that table_name is stored on the error."""
-        error = DataValidationError("orders", self.results)
+        error = DataValidationError("orders", list(self.results))
         self.assertEqual(error.table_name, "orders")
 
     def test_result_separation(self):
@@ -63,7 +74,7 @@ class TestDataValidationError(unittest.TestCase):
         test_cases = [
             {
                 "label": "mixed_results",
-                "results": self.results,
+                "results": list(self.results),
                 "expected_total": 3,
                 "expected_passed": 2,
                 "expected_failed": 1,
@@ -95,20 +106,11 @@ class TestDataValidationError(unittest.TestCase):
 
     def test_message_formatting(self):
         """Test that error message contains expected markers."""
-        error = DataValidationError("customers", self.results)
+        error = DataValidationError("customers", list(self.results))
         message = str(error)
 
-        expected_fragments = [
-            ("header", "Validation failed for table 'customers'"),
-            ("failure_count", "1 of 3 checks failed"),
-            ("pass_marker", "[PASS] row_count:"),
-            ("fail_marker", "[FAIL] column_count:"),
-            ("pass_marker_2", "[PASS] unique_id_count:"),
-        ]
-
-        for label, fragment in expected_fragments:
-            with self.subTest(fragment=label):
-                self.assertIn(fragment, message)
+        missing = [label for label, fragment in _EXPECTED_FRAGMENTS if fragment not in message]
+        self.assertEqual(missing, [], f"missing fragments: {missing}\nmessage was:\n{message}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,17 @@
 """Tests for DatabricksLogger — unit (mock-based) and Databricks integration."""
 
+import gc
 import os
 import unittest
+import weakref
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
-from pyspark.sql import SparkSession
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.functions import col, lit
 from pyspark.sql.types import Row
 
+from data_ops.utils import logging as logging_module
 from data_ops.utils.logging import DatabricksLogger, LogStatus, create_logger
 
 
@@ -16,6 +20,24 @@ from data_ops.utils.logging import DatabricksLogger, LogStatus, create_logger
 # ---------------------------------------------------------------------------
 
 
+def _last_logged_row(mock_spark):
+    """Return the most recently written log row, via createDataFrame or INSERT."""
+    for name, args, kwargs in reversed(mock_spark.mock_calls):
+        if name == "createDataFrame":
+            return args[0][-1]
+        if name == "sql" and "args" in kwargs:
+            return tuple(kwargs["args"])
+    raise AssertionError("no log row was written")
+
+
+def _mock_df():
+    """Return a DataFrame-spec mock whose filter/limit chain back to itself."""
+    df = MagicMock(spec=DataFrame)
+    df.filter.return_value = df
+    df.limit.return_value = df
+    return df
+
+
 class TestDatabricksLoggerInitialization(unittest.TestCase):
 
     def setUp(self):
@@ -68,6 +90,7 @@ class TestDatabricksLoggerAutoDetection(unittest.TestCase):
     def setUp(self):
         self.mock_spark = MagicMock()
         self.log_table_path = "test_catalog.test_schema.test_logs"
+        logging_module._USER_CACHE.clear()
 
     def test_user_detection_from_sql(self):
         mock_result = MagicMock()
@@ -91,6 +114,43 @@ class TestDatabricksLoggerAutoDetection(unittest.TestCase):
             )
             self.assertEqual(logger._user, "test_user")
 
+    def test_user_detection_cached_per_session(self):
+        mock_result = self.mock_spark.sql.return_value
+        mock_result.collect.return_value = [Row(current_user="cached@example.com")]
+        loggers = [
+            DatabricksLogger(
+                domain="test",
+                process=process,
+                log_table_path=self.log_table_path,
+                spark=self.mock_spark,
+            )
+            for process in ("bronze", "silver")
+        ]
+        self.assertEqual([logger._user for logger in loggers], ["cached@example.com"] * 2)
+        self.mock_spark.sql.assert_called_once_with("SELECT current_user()")
+
+    def test_user_cache_released_with_session(self):
+        spark = MagicMock()
+        spark.sql.return_value.collect.return_value = [Row(current_user="old@example.com")]
+        DatabricksLogger(
+            domain="test", process="test", log_table_path=self.log_table_path, spark=spark
+        )
+        self.assertEqual(len(logging_module._USER_CACHE), 1)
+        del spark
+        gc.collect()
+        self.assertEqual(len(logging_module._USER_CACHE), 0)
+
+    def test_user_provider_skips_detection(self):
+        logger = DatabricksLogger(
+            domain="test",
+            process="test",
+            log_table_path=self.log_table_path,
+            spark=self.mock_spark,
+            user_provider=lambda: "injected_user",
+        )
+        self.assertEqual(logger._user, "injected_user")
+        self.mock_spark.sql.assert_not_called()
+
     def test_source_detection(self):
         logger = DatabricksLogger(
             domain="test", process="test", log_table_path=self.log_table_path, spark=self.mock_spark
@@ -100,19 +160,83 @@ class TestDatabricksLoggerAutoDetection(unittest.TestCase):
         self.assertNotEqual(source, "unknown_source")
         self.assertIn("test_logging", source)
 
+    def test_notebook_path_probed_once(self):
+        logger = DatabricksLogger(
+            domain="test", process="test", log_table_path=self.log_table_path, spark=self.mock_spark
+        )
+        self.mock_spark.conf.get.reset_mock()
+        logger._detect_source()
+        logger._detect_source()
+        self.assertIsNone(logger._get_notebook_path())
+        self.mock_spark.conf.get.assert_not_called()
+
+    def test_relative_source(self):
+        cwd = os.getcwd()
+        cases = [
+            (os.path.join(cwd, "pipelines", "bronze.py"), os.path.join("pipelines", "bronze.py")),
+            (os.path.join(os.path.dirname(cwd), "elsewhere", "job.py"), "job.py"),
+        ]
+        for filename, expected in cases:
+            with self.subTest(filename=filename):
+                self.assertEqual(logging_module._relative_source(filename), expected)
+
+    def test_source_detection_depth_is_capped(self):
+        logger = DatabricksLogger(
+            domain="test", process="test", log_table_path=self.log_table_path, spark=self.mock_spark
+        )
+        with patch("data_ops.utils.logging._skip_frame", return_value=True) as mock_skip:
+            source = logger._detect_source()
+        self.assertEqual(source, "unknown_source")
+        self.assertEqual(mock_skip.call_count, logging_module._MAX_SOURCE_DEPTH)
+
+    def test_source_detection_cached_per_file(self):
+        logging_module._SOURCE_CACHE.clear()
+        with patch(
+            "data_ops.utils.logging._relative_source", return_value="cached/source.py"
+        ) as mock_relative:
+            # Construction detects the source from this test method's frame too
+            logger = DatabricksLogger(
+                domain="test",
+                process="test",
+                log_table_path=self.log_table_path,
+                spark=self.mock_spark,
+            )
+            sources = []
+            for _ in range(3):
+                sources.append(logger._detect_source())
+        self.assertEqual(logger._source, "cached/source.py")
+        self.assertEqual(sources, ["cached/source.py"] * 3)
+        mock_relative.assert_called_once()
+
+    def test_identical_functions_in_different_files(self):
+        logger = DatabricksLogger(
+            domain="test", process="test", log_table_path=self.log_table_path, spark=self.mock_spark
+        )
+        body = "def main(logger):\n    return logger._detect_source()\n"
+        sources = []
+        for filename in (os.path.join("a", "job.py"), os.path.join("b", "job.py")):
+            namespace: dict = {}
+            exec(compile(body, filename, "exec"), namespace)
+            sources.append(namespace["main"](logger))
+        self.assertEqual(sources, [os.path.join("a", "job.py"), os.path.join("b", "job.py")])
+
 
 class TestDatabricksLoggerLogging(unittest.TestCase):
 
-    def setUp(self):
-        self.mock_spark = MagicMock()
-        self.log_table_path = "test_catalog.test_schema.test_logs"
-        self.logger = DatabricksLogger(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_spark = MagicMock()
+        cls.log_table_path = "test_catalog.test_schema.test_logs"
+        cls.logger = DatabricksLogger(
             domain="test_domain",
             process="test_process",
-            log_table_path=self.log_table_path,
-            spark=self.mock_spark,
+            log_table_path=cls.log_table_path,
+            spark=cls.mock_spark,
         )
 
+    def setUp(self):
+        self.mock_spark.reset_mock()
+
     def test_log_with_different_statuses(self):
         cases: list[tuple[LogStatus, str]] = [
             ("success", "Test success message"),
@@ -122,7 +246,7 @@ class TestDatabricksLoggerLogging(unittest.TestCase):
         for status, message in cases:
             with self.subTest(status=status):
                 self.logger.log(step="test_step", status=status, message=message)
-                log_data = self.mock_spark.createDataFrame.call_args[0][0][0]
+                log_data = _last_logged_row(self.mock_spark)
                 self.assertEqual(log_data[3], "test_domain")
                 self.assertEqual(log_data[4], "test_process")
                 self.assertEqual(log_data[5], "test_step")
@@ -142,35 +266,58 @@ class TestDatabricksLoggerLogging(unittest.TestCase):
                 self.assertIn(case["error"], str(ctx.exception))
 
     def test_log_contains_date_and_time(self):
-        before_log = datetime.now()
-        self.logger.log(step="test_step", status="success", message="Test message")
-        after_log = datetime.now()
+        frozen_now = datetime(2024, 1, 1, 12, 0, 0)
+        logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path=self.log_table_path,
+            spark=self.mock_spark,
+            clock=lambda: frozen_now,
+        )
+        logger.log(step="test_step", status="success", message="Test message")
+
+        log_data = _last_logged_row(self.mock_spark)
+        self.assertEqual(log_data[0], "2024-01-01")
+        self.assertEqual(log_data[1], frozen_now)
 
-        log_data = self.mock_spark.createDataFrame.call_args[0][0][0]
-        self.assertEqual(log_data[0], date.today().isoformat())
-        self.assertGreaterEqual(log_data[1], before_log)
-        self.assertLessEqual(log_data[1], after_log)
+    def test_log_without_source_capture(self):
+        logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path=self.log_table_path,
+            spark=self.mock_spark,
+            capture_source=False,
+        )
+        with patch.object(logger, "_detect_source") as mock_detect:
+            logger.log(step="test_step", status="success", message="Test message")
+        mock_detect.assert_not_called()
+        log_data = _last_logged_row(self.mock_spark)
+        self.assertEqual(log_data[6], logger._source)
 
     def test_log_with_source_override(self):
         custom_source = "custom/source/file.py"
         self.logger.log(
             step="test_step", status="success", message="Test message", source_override=custom_source
         )
-        log_data = self.mock_spark.createDataFrame.call_args[0][0][0]
+        log_data = _last_logged_row(self.mock_spark)
         self.assertEqual(log_data[6], custom_source)
 
 
 class TestDatabricksLoggerConvenienceMethods(unittest.TestCase):
 
-    def setUp(self):
-        self.mock_spark = MagicMock()
-        self.logger = DatabricksLogger(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_spark = MagicMock()
+        cls.logger = DatabricksLogger(
             domain="test_domain",
             process="test_process",
             log_table_path="test_catalog.test_schema.test_logs",
-            spark=self.mock_spark,
+            spark=cls.mock_spark,
         )
 
+    def setUp(self):
+        self.mock_spark.reset_mock()
+
     def test_convenience_methods(self):
         cases = [
             {"method": "success", "expected_status": "success", "message": "Success message"},
@@ -180,23 +327,27 @@ class TestDatabricksLoggerConvenienceMethods(unittest.TestCase):
         for case in cases:
             with self.subTest(method=case["method"]):
                 getattr(self.logger, case["method"])(step="test_step", message=case["message"])
-                log_data = self.mock_spark.createDataFrame.call_args[0][0][0]
+                log_data = _last_logged_row(self.mock_spark)
                 self.assertEqual(log_data[7], case["expected_status"])
                 self.assertEqual(log_data[8], case["message"])
 
 
 class TestDatabricksLoggerWriteToDelta(unittest.TestCase):
 
-    def setUp(self):
-        self.mock_spark = MagicMock()
-        self.log_table_path = "test_catalog.test_schema.test_logs"
-        self.logger = DatabricksLogger(
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_spark = MagicMock()
+        cls.log_table_path = "test_catalog.test_schema.test_logs"
+        cls.logger = DatabricksLogger(
             domain="test_domain",
             process="test_process",
-            log_table_path=self.log_table_path,
-            spark=self.mock_spark,
+            log_table_path=cls.log_table_path,
+            spark=cls.mock_spark,
         )
 
+    def setUp(self):
+        self.mock_spark.reset_mock()
+
     def test_write_modes(self):
         cases = [
             {"table_exists": True, "expected_mode": "append"},
@@ -204,6 +355,7 @@ class TestDatabricksLoggerWriteToDelta(unittest.TestCase):
         ]
         for case in cases:
             with self.subTest(table_exists=case["table_exists"]):
+                self.logger.reset_table_cache()
                 self.mock_spark.catalog.tableExists.return_value = case["table_exists"]
                 mock_df = MagicMock()
                 self.mock_spark.createDataFrame.return_value = mock_df
@@ -214,21 +366,262 @@ class TestDatabricksLoggerWriteToDelta(unittest.TestCase):
                 mock_df.write.format.assert_called_with("delta")
                 mock_df.write.format.return_value.mode.assert_called_with(case["expected_mode"])
 
+    def test_table_existence_checked_once(self):
+        self.logger.reset_table_cache()
+        self.mock_spark.catalog.tableExists.return_value = False
+        mock_df = MagicMock()
+        self.mock_spark.createDataFrame.return_value = mock_df
 
-class TestDatabricksLoggerGetLogs(unittest.TestCase):
+        self.logger.log(step="step_1", status="success", message="First")
+        self.logger.log(step="step_2", status="success", message="Second")
+
+        self.mock_spark.catalog.tableExists.assert_called_once_with(self.log_table_path)
+        mock_df.write.format.return_value.mode.assert_called_once_with("overwrite")
+
+    def test_single_row_inserted_once_table_exists(self):
+        self.logger.reset_table_cache()
+        self.mock_spark.catalog.tableExists.return_value = True
+
+        self.logger.log(step="step_1", status="success", message="First")
+        self.mock_spark.createDataFrame.reset_mock()
+        self.logger.log(step="step_2", status="warning", message="Second")
+
+        self.mock_spark.createDataFrame.assert_not_called()
+        query = self.mock_spark.sql.call_args.args[0]
+        self.assertTrue(query.startswith(f"INSERT INTO {self.log_table_path} (`date`, `time`"))
+        self.assertEqual(query.count("?"), len(DatabricksLogger.LOG_SCHEMA.fields))
+        row = self.mock_spark.sql.call_args.kwargs["args"]
+        self.assertEqual((row[5], row[7], row[8]), ("step_2", "warning", "Second"))
+
+    def test_dropped_table_is_recreated(self):
+        self.logger.reset_table_cache()
+        self.mock_spark.catalog.tableExists.return_value = True
+        self.logger.log(step="step_1", status="success", message="First")
+
+        # The table is dropped: the single-row INSERT fails and the write falls back
+        self.mock_spark.sql.side_effect = Exception("[TABLE_OR_VIEW_NOT_FOUND] missing")
+        self.mock_spark.catalog.tableExists.return_value = False
+        mock_df = MagicMock()
+        self.mock_spark.createDataFrame.return_value = mock_df
+        try:
+            self.logger.log(step="step_2", status="success", message="Second")
+        finally:
+            self.mock_spark.sql.side_effect = None
+
+        mock_df.write.format.return_value.mode.assert_called_once_with("overwrite")
+        self.assertTrue(self.logger._table_confirmed)
+
+
+class TestDatabricksLoggerLogMany(unittest.TestCase):
 
     def setUp(self):
         self.mock_spark = MagicMock()
-        self.log_table_path = "test_catalog.test_schema.test_logs"
         self.logger = DatabricksLogger(
             domain="test_domain",
             process="test_process",
-            log_table_path=self.log_table_path,
+            log_table_path="test_catalog.test_schema.test_logs",
+            spark=self.mock_spark,
+        )
+
+    def test_single_write_for_all_entries(self):
+        entries: list[tuple[str, LogStatus, str]] = [
+            ("step_1", "success", "Success message"),
+            ("step_2", "warning", "Warning message"),
+            ("step_3", "failure", "Failure message"),
+        ]
+        self.logger.log_many(entries)
+
+        self.mock_spark.createDataFrame.assert_called_once()
+        rows = self.mock_spark.createDataFrame.call_args[0][0]
+        self.assertEqual([(r[5], r[7], r[8]) for r in rows], entries)
+
+    def test_invalid_entry_logs_nothing(self):
+        with self.assertRaises(ValueError):
+            entries = [("step_1", "success", "ok"), ("step_2", "invalid", "bad")]
+            self.logger.log_many(entries)  # type: ignore[arg-type]
+        self.mock_spark.createDataFrame.assert_not_called()
+
+    def test_empty_entries_is_noop(self):
+        self.logger.log_many([])
+        self.mock_spark.createDataFrame.assert_not_called()
+
+
+class TestDatabricksLoggerBuffering(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_spark = MagicMock()
+        self.logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path="test_catalog.test_schema.test_logs",
+            spark=self.mock_spark,
+            buffered=True,
+        )
+        # Start each test from the DataFrame write path
+        self.logger.reset_table_cache()
+
+    def test_log_is_held_until_flush(self):
+        self.logger.success(step="step_1", message="First")
+        self.logger.failure(step="step_2", message="Second")
+        self.mock_spark.createDataFrame.assert_not_called()
+
+        self.logger.flush()
+
+        self.mock_spark.createDataFrame.assert_called_once()
+        rows = self.mock_spark.createDataFrame.call_args[0][0]
+        self.assertEqual(
+            [(r[5], r[7]) for r in rows], [("step_1", "success"), ("step_2", "failure")]
+        )
+
+    def test_flush_without_pending_entries_is_noop(self):
+        self.logger.flush()
+        self.mock_spark.createDataFrame.assert_not_called()
+
+    def test_flush_clears_pending_entries(self):
+        self.logger.success(step="step_1", message="First")
+        self.logger.flush()
+        self.logger.flush()
+        self.mock_spark.createDataFrame.assert_called_once()
+
+    def test_failed_flush_keeps_entries(self):
+        self.logger.success(step="step_1", message="First")
+        self.mock_spark.createDataFrame.side_effect = Exception("write failed")
+        with self.assertRaises(RuntimeError):
+            self.logger.flush()
+        self.assertEqual([row[5] for row in self.logger._pending], ["step_1"])
+
+        self.mock_spark.createDataFrame.side_effect = None
+        self.logger.flush()
+        self.assertEqual(self.logger._pending, [])
+
+    def test_flushes_automatically_at_buffer_limit(self):
+        logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path="test_catalog.test_schema.test_logs",
             spark=self.mock_spark,
+            buffered=True,
+            buffer_limit=2,
         )
+        logger.success(step="step_1", message="First")
+        self.mock_spark.createDataFrame.assert_not_called()
+
+        logger.success(step="step_2", message="Second")
+
+        self.mock_spark.createDataFrame.assert_called_once()
+        self.assertEqual(len(self.mock_spark.createDataFrame.call_args[0][0]), 2)
+        self.assertEqual(logger._pending, [])
+
+    def test_pending_entries_flushed_at_exit(self):
+        self.logger.success(step="step_1", message="First")
+        logging_module._close_open_loggers()
+        self.mock_spark.createDataFrame.assert_called_once()
+
+    def test_exit_hook_does_not_keep_logger_alive(self):
+        logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path="test_catalog.test_schema.test_logs",
+            spark=self.mock_spark,
+            buffered=True,
+        )
+        self.assertIn(logger, logging_module._OPEN_LOGGERS)
+        logger_ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+        self.assertIsNone(logger_ref())
+
+    def test_invalid_buffer_limit(self):
+        with self.assertRaises(ValueError):
+            DatabricksLogger(
+                domain="test_domain",
+                process="test_process",
+                log_table_path="test_catalog.test_schema.test_logs",
+                spark=self.mock_spark,
+                buffered=True,
+                buffer_limit=0,
+            )
+
+
+class TestDatabricksLoggerAsyncWrites(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_spark = MagicMock()
+        self.logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path="test_catalog.test_schema.test_logs",
+            spark=self.mock_spark,
+            async_writes=True,
+        )
+        self.addCleanup(self.logger.close)
+        self.logger.reset_table_cache()
+
+    def test_flush_waits_for_background_writes(self):
+        self.logger.success(step="step_1", message="First")
+        self.logger.success(step="step_2", message="Second")
+        self.logger.flush()
+
+        self.assertTrue(self.logger._queue.empty())
+        self.assertEqual(_last_logged_row(self.mock_spark)[5], "step_2")
+
+    def test_background_failure_raised_on_flush(self):
+        self.mock_spark.createDataFrame.side_effect = Exception("write failed")
+        self.logger.failure(step="step_1", message="First")
+
+        with self.assertRaises(RuntimeError):
+            self.logger.flush()
+        # The error is reported once, and the failed entry is retried
+        self.mock_spark.createDataFrame.side_effect = None
+        self.logger.flush()
+
+        self.assertEqual(self.logger._pending, [])
+        self.assertEqual(_last_logged_row(self.mock_spark)[5], "step_1")
+
+    def test_failed_background_write_keeps_entries(self):
+        self.mock_spark.createDataFrame.side_effect = Exception("write failed")
+        self.logger.failure(step="step_1", message="First")
+
+        with self.assertRaises(RuntimeError):
+            self.logger.flush()
+        self.assertEqual([row[5] for row in self.logger._pending], ["step_1"])
+        # Still failing: the entry stays pending for a later flush
+        with self.assertRaises(RuntimeError):
+            self.logger.flush()
+        self.assertEqual(len(self.logger._pending), 1)
+        self.mock_spark.createDataFrame.side_effect = None
+
+    def test_close_stops_worker(self):
+        worker = self.logger._worker
+        self.logger.success(step="step_1", message="First")
+        self.logger.close()
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(_last_logged_row(self.mock_spark)[5], "step_1")
+
+        # Later entries are written synchronously
+        self.logger.success(step="step_2", message="Second")
+        self.assertEqual(_last_logged_row(self.mock_spark)[5], "step_2")
+
+
+class TestDatabricksLoggerGetLogs(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_spark = MagicMock()
+        cls.log_table_path = "test_catalog.test_schema.test_logs"
+        cls.logger = DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path=cls.log_table_path,
+            spark=cls.mock_spark,
+        )
+
+    def setUp(self):
+        self.mock_spark.reset_mock()
 
     def test_get_logs_without_filters(self):
-        mock_df = MagicMock()
+        mock_df = _mock_df()
         self.mock_spark.read.format.return_value.table.return_value = mock_df
         self.logger.get_logs()
         self.mock_spark.read.format.assert_called_once_with("delta")
@@ -239,28 +632,24 @@ class TestDatabricksLoggerGetLogs(unittest.TestCase):
     def test_get_logs_with_filters(self):
         cases = [
             {"filters": {"status": "failure"}, "expected_filter_count": 1},
-            {"filters": {"status": "failure", "step": "test_step"}, "expected_filter_count": 2},
+            {"filters": {"status": "failure", "step": "test_step"}, "expected_filter_count": 1},
         ]
         for case in cases:
             with self.subTest(filters=case["filters"]):
-                mock_df = MagicMock()
-                mock_df.filter.return_value = mock_df
+                mock_df = _mock_df()
                 self.mock_spark.read.format.return_value.table.return_value = mock_df
                 self.logger.get_logs(filters=case["filters"])
                 self.assertEqual(mock_df.filter.call_count, case["expected_filter_count"])
                 mock_df.reset_mock()
 
     def test_get_logs_with_limit(self):
-        mock_df = MagicMock()
-        mock_df.limit.return_value = mock_df
+        mock_df = _mock_df()
         self.mock_spark.read.format.return_value.table.return_value = mock_df
         self.logger.get_logs(limit=10)
         mock_df.limit.assert_called_once_with(10)
 
     def test_get_logs_with_filters_and_limit(self):
-        mock_df = MagicMock()
-        mock_df.filter.return_value = mock_df
-        mock_df.limit.return_value = mock_df
+        mock_df = _mock_df()
         self.mock_spark.read.format.return_value.table.return_value = mock_df
         self.logger.get_logs(filters={"status": "failure"}, limit=5)
         mock_df.filter.assert_called_once()
@@ -326,6 +715,14 @@ class TestDatabricksLoggerIntegration(unittest.TestCase):
     def setUpClass(cls):
         cls.spark = SparkSession.builder.getOrCreate()
         cls.test_table_path = "dev.bronze.test_logging"
+        # Create the table once; each test then empties it rather than dropping it.
+        cls.spark.sql(f"DROP TABLE IF EXISTS {cls.test_table_path}")
+        DatabricksLogger(
+            domain="test_domain",
+            process="test_process",
+            log_table_path=cls.test_table_path,
+            spark=cls.spark,
+        ).success("__init__", "Create integration test log table")
 
     @classmethod
     def tearDownClass(cls):
@@ -336,10 +733,7 @@ class TestDatabricksLoggerIntegration(unittest.TestCase):
         cls.spark.stop()
 
     def setUp(self):
-        try:
-            self.spark.sql(f"DROP TABLE IF EXISTS {self.test_table_path}")
-        except Exception:
-            pass
+        self.spark.sql(f"DELETE FROM {self.test_table_path}")
 
     def test_initialization_with_databricks_session(self):
         logger = DatabricksLogger(
@@ -360,21 +754,21 @@ class TestDatabricksLoggerIntegration(unittest.TestCase):
             log_table_path=self.test_table_path,
             spark=self.spark,
         )
-        cases = [
-            {"method": "success", "step": "step_1", "message": "Success message"},
-            {"method": "warning", "step": "step_2", "message": "Warning message"},
-            {"method": "failure", "step": "step_3", "message": "Failure message"},
+        cases: list[tuple[str, LogStatus, str]] = [
+            ("step_1", "success", "Success message"),
+            ("step_2", "warning", "Warning message"),
+            ("step_3", "failure", "Failure message"),
         ]
-        for case in cases:
-            getattr(logger, case["method"])(step=case["step"], message=case["message"])
+        logger.log_many(cases)
 
         df = self.spark.read.format("delta").table(self.test_table_path)
         self.assertEqual(df.count(), len(cases))
 
-        for case in cases:
-            with self.subTest(method=case["method"]):
-                row = df.filter(f"step = '{case['step']}'").collect()[0]
-                self.assertEqual(row["message"], case["message"])
+        for step, status, message in cases:
+            with self.subTest(status=status):
+                row = df.where(col("step") == lit(step)).head()
+                self.assertEqual(row["status"], status)
+                self.assertEqual(row["message"], message)
 
     def test_log_metadata(self):
         logger = create_logger(
@@ -465,7 +859,7 @@ class TestDatabricksLoggerIntegration(unittest.TestCase):
         df = self.spark.read.format("delta").table(self.test_table_path)
         for case in cases:
             with self.subTest(step=case["step"]):
-                row = df.filter(f"step = '{case['step']}'").collect()[0]
+                row = df.where(col("step") == lit(case["step"])).head()
                 self.assertEqual(row["message"], case["message"])
 
 
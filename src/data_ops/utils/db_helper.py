@@ -4,8 +4,35 @@ Provides helpers for Spark session access, catalog discovery, DBUtils,
 and notebook execution with retry logic.
 """
 
-from pyspark.dbutils import DBUtils
+import logging
+import os
+import re
+import time
+import weakref
+from typing import TYPE_CHECKING
+
 from pyspark.sql import SparkSession
+from pyspark.sql import functions as F
+
+if TYPE_CHECKING:
+    from pyspark.dbutils import DBUtils
+
+
+logger = logging.getLogger(__name__)
+
+_SPARK: SparkSession | None = None
+
+# DBUtils handle per SparkSession. Weak keys: an entry goes away with its session
+# instead of keeping it alive
+_DBUTILS: "weakref.WeakKeyDictionary[SparkSession, DBUtils]" = weakref.WeakKeyDictionary()
+
+# Catalog name per match_str, per SparkSession, held weakly like _DBUTILS
+_CATALOGS: "weakref.WeakKeyDictionary[SparkSession, dict[str, str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# match_str is interpolated into SQL, so only plain identifier characters are allowed
+_CATALOG_MATCH_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
 
 
 def get_spark() -> SparkSession:
@@ -13,41 +40,115 @@ def get_spark() -> SparkSession:
 
     On Databricks, this returns the existing cluster session.
     For local development, use DatabricksSession.builder.getOrCreate() directly.
+    The session is resolved once and reused by later calls until it is
+    stopped, after which a new one is created.
 
     Returns:
         Active SparkSession instance.
     """
-    return SparkSession.builder.getOrCreate()
+    global _SPARK
+    if _SPARK is None or _is_stopped(_SPARK):
+        _SPARK = SparkSession.builder.getOrCreate()
+    return _SPARK
+
+
+def _is_stopped(spark: SparkSession) -> bool:
+    """Return True if spark has been stopped, without a round trip to the JVM/server.
+
+    getActiveSession() is avoided: on classic PySpark it calls into the JVM, and
+    under Spark Connect it is thread-local (None off the main thread).
+    """
+    # Spark Connect sessions track this themselves
+    stopped = getattr(spark, "is_stopped", None)
+    if stopped is not None:
+        return bool(stopped)
+    # Classic sessions drop the Java context on stop()
+    return spark._sc._jsc is None
 
 
 def get_catalog(spark: SparkSession, match_str: str) -> str:
     """Return the first catalog name containing match_str.
 
+    The match is pushed down to the metastore with ``SHOW CATALOGS LIKE`` and
+    only a single row is returned to the driver. Results are cached per
+    (session, match_str), and dropped along with their session; set
+    ``DATA_OPS_DISABLE_CATALOG_CACHE`` to bypass the cache, or call
+    ``get_catalog.cache_clear()`` to reset it.
+
     Args:
         spark: Active Spark session.
-        match_str: Substring to match catalog names against.
+        match_str: Substring to match catalog names against. Letters, digits,
+            underscores, and hyphens only.
 
     Returns:
         First catalog name containing match_str.
 
     Raises:
-        IndexError: If no catalog matches match_str.
+        ValueError: If match_str contains characters outside the allowed set.
+        LookupError: If no catalog matches match_str.
     """
-    catalogs_df = spark.sql("SHOW CATALOGS")
-    matches = [row.catalog for row in catalogs_df.collect() if match_str in row.catalog]
-    return matches[0]
+    if not _CATALOG_MATCH_PATTERN.fullmatch(match_str):
+        raise ValueError(f"Invalid catalog match string: '{match_str}'")
+
+    if os.environ.get("DATA_OPS_DISABLE_CATALOG_CACHE"):
+        return _lookup_catalog(spark, match_str)
+
+    catalogs = _CATALOGS.setdefault(spark, {})
+    catalog = catalogs.get(match_str)
+    if catalog is None:
+        catalog = catalogs[match_str] = _lookup_catalog(spark, match_str)
+    return catalog
+
 
+def _lookup_catalog(spark: SparkSession, match_str: str) -> str:
+    """Query the metastore for the first catalog containing match_str.
 
-def get_dbutils(spark: SparkSession) -> DBUtils:
+    Args:
+        spark: Active Spark session.
+        match_str: Validated substring to match catalog names against.
+
+    Returns:
+        First catalog name containing match_str.
+
+    Raises:
+        LookupError: If no catalog matches match_str (not cached).
+    """
+    # LIKE prunes in the metastore but ignores case; contains() keeps the match
+    # case-sensitive. first() returns a single Row without building a list.
+    row = (
+        spark.sql(f"SHOW CATALOGS LIKE '*{match_str}*'")
+        .filter(F.col("catalog").contains(match_str))
+        .select("catalog")
+        .first()
+    )
+    if row is None:
+        raise LookupError(f"No catalog name contains '{match_str}'")
+    return row.catalog
+
+
+get_catalog.cache_clear = _CATALOGS.clear  # type: ignore[attr-defined]
+
+
+def get_dbutils(spark: SparkSession) -> "DBUtils":
     """Get DBUtils for interacting with the Databricks file system and secrets.
 
+    Instances are cached per SparkSession (held weakly), so repeated calls (e.g.
+    one per VolumeExtractor) reuse the same handle. ``pyspark.dbutils`` is
+    imported here rather than at module level so importing ``data_ops.utils``
+    doesn't require the Databricks runtime.
+
     Args:
         spark: Active Spark session.
 
     Returns:
         DBUtils instance.
     """
-    return DBUtils(spark)
+    dbutils = _DBUTILS.get(spark)
+    if dbutils is None:
+        from pyspark.dbutils import DBUtils
+
+        dbutils = _DBUTILS[spark] = DBUtils(spark)
+    return dbutils
 
 
 def run_with_retry(
@@ -59,6 +160,9 @@ def run_with_retry(
 ) -> str:
     """Run a Databricks notebook with automatic retry on failure.
 
+    Waits with exponential backoff (1s, 2s, 4s, ... capped at 30s) between
+    attempts.
+
     Args:
         spark: Active Spark session.
         notebook: Path to the notebook to run.
@@ -81,5 +185,6 @@ def run_with_retry(
         except Exception as e:
             if num_retries >= max_retries:
                 raise
-            print(f"Retrying error: {e}")
+            logger.warning("Retrying notebook %s after error: %s", notebook, e)
+            time.sleep(min(2**num_retries, 30))
             num_retries += 1
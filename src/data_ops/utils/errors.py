@@ -8,10 +8,12 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Stores the outcome of a single validation check.
 
+    Immutable and slotted, since pipelines can emit many of these per run.
+
     Attributes:
         check_name: Identifier for the check (e.g., 'row_count', 'column_count')
         expected: The expected value
@@ -43,19 +45,31 @@ class DataValidationError(Exception):
     def __init__(self, table_name: str, results: list[ValidationResult]):
         self.table_name = table_name
         self.results = results
-        self.passed_results = [r for r in results if r.passed]
-        self.failed_results = [r for r in results if not r.passed]
-        super().__init__(self._build_message())
+        self.passed_results: list[ValidationResult] = []
+        self.failed_results: list[ValidationResult] = []
+
+        # Partition the results and format their lines in a single pass,
+        # with the list appends bound once outside the loop
+        lines: list[str] = []
+        add_line = lines.append
+        add_passed = self.passed_results.append
+        add_failed = self.failed_results.append
+        for r in results:
+            if r.passed:
+                add_passed(r)
+                add_line(f"  [PASS] {r.check_name}: {r.message}")
+            else:
+                add_failed(r)
+                add_line(f"  [FAIL] {r.check_name}: {r.message}")
+
+        super().__init__(self._build_message(lines))
 
-    def _build_message(self) -> str:
-        """Format all validation results with [PASS]/[FAIL] prefixes."""
+    def _build_message(self, lines: list[str]) -> str:
+        """Prepend the failure summary to the [PASS]/[FAIL] result lines."""
         total = len(self.results)
         failed = len(self.failed_results)
-        lines = [
+        header = (
             f"Validation failed for table '{self.table_name}': "
             f"{failed} of {total} checks failed"
-        ]
-        for r in self.results:
-            prefix = "[PASS]" if r.passed else "[FAIL]"
-            lines.append(f"  {prefix} {r.check_name}: {r.message}")
-        return "\n".join(lines)
+        )
+        return "\n".join([header, *lines])
@@ -4,10 +4,17 @@ This module provides a custom logger that writes log entries to Delta tables
 with automatic detection of runtime context and structured log information.
 """
 
-import inspect
+import atexit
 import os
-from datetime import date, datetime
-from pathlib import Path
+import queue
+import sys
+import threading
+import weakref
+from collections.abc import Callable
+from datetime import datetime
+from functools import reduce
+from operator import and_
+from types import FrameType
 from typing import Literal, Optional
 
 from pyspark.sql import DataFrame, SparkSession
@@ -15,6 +22,77 @@ from pyspark.sql.types import StringType, StructField, StructType, TimestampType
 
 LogStatus = Literal["success", "warning", "failure"]
 
+_VALID_STATUSES: frozenset[str] = frozenset(("success", "warning", "failure"))
+
+# Frames whose code lives in this module are skipped during source detection
+_THIS_FILE = __file__
+
+# Frames inspected when looking for the caller of log() before giving up
+_MAX_SOURCE_DEPTH = 12
+
+# Filename fragments of library/interpreter frames that are never a log source
+_SKIP_SUBSTRINGS = ("site-packages", "lib/python", "importlib", "runpy")
+
+# Working directory used to shorten source paths, captured once at import
+_CWD = os.getcwd()
+_CWD_PREFIX = os.path.join(_CWD, "")
+
+# Marks a per-instance cache that has not been filled yet (None is a valid value)
+_UNSET = object()
+
+# Shortened source per frame filename, filled in by _detect_source
+_SOURCE_CACHE: dict[str, str] = {}
+
+# current_user() per SparkSession, so each session queries it once. Weak keys: an
+# entry goes away with its session and can't be inherited by a later one
+_USER_CACHE: "weakref.WeakKeyDictionary[SparkSession, str]" = weakref.WeakKeyDictionary()
+
+
+# Buffered/async loggers still alive at interpreter exit are closed by one hook
+_OPEN_LOGGERS: "weakref.WeakSet[DatabricksLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    """Close every buffered/async logger that is still alive, reporting failures."""
+    for logger in list(_OPEN_LOGGERS):
+        try:
+            logger.close()
+        except Exception as e:
+            print(f"Failed to flush logs for {logger.log_table_path}: {e}", file=sys.stderr)
+
+
+def _check_status(status: str) -> None:
+    """Raise ValueError unless status is one of the LogStatus values."""
+    if status not in _VALID_STATUSES:
+        raise ValueError(f"Invalid status: {status}. Must be success, warning, or failure")
+
+
+def _relative_source(filename: str) -> str:
+    """Return filename relative to the working directory, or its name if outside it.
+
+    Pure string work against the working directory captured at import, so no
+    filesystem calls are made per log entry.
+    """
+    path = os.path.normpath(os.path.join(_CWD, filename))
+    if path.startswith(_CWD_PREFIX):
+        return path[len(_CWD_PREFIX) :]
+    return os.path.basename(path)
+
+
+def _skip_frame(filename: str) -> bool:
+    """Return True for frames that can never be the source of a log call."""
+    # Skip frames from this logging module
+    if filename == _THIS_FILE:
+        return True
+
+    # Skip internal Python library frames
+    if any(part in filename for part in _SKIP_SUBSTRINGS):
+        return True
+
+    # Skip unittest/testing framework frames (but not the test file itself)
+    return "unittest" in filename and not os.path.basename(filename).startswith("test_")
+
 
 class DatabricksLogger:
     """Custom logger that emits logs to Delta tables in Databricks.
@@ -27,6 +105,10 @@ class DatabricksLogger:
         process: The process being executed (e.g., ingestion, bronze, silver, gold)
         log_table_path: Path to the Delta table where logs are stored
         spark: SparkSession instance
+        buffered: If True, entries are held in memory until flush() is called
+        buffer_limit: Number of buffered entries that triggers an automatic flush
+        capture_source: If False, every entry uses the source detected at construction
+        async_writes: If True, entries are written to Delta by a background thread
     """
 
     # Schema for the log Delta table
@@ -50,6 +132,12 @@ class DatabricksLogger:
         process: str,
         log_table_path: str,
         spark: Optional[SparkSession] = None,
+        buffered: bool = False,
+        buffer_limit: int = 50,
+        capture_source: bool = True,
+        async_writes: bool = False,
+        clock: Callable[[], datetime] = datetime.now,
+        user_provider: Optional[Callable[[], str]] = None,
     ):
         """Initialize the Databricks logger.
 
@@ -60,17 +148,51 @@ class DatabricksLogger:
             log_table_path: Path to the Delta table for logs
                            (e.g., 'catalog.schema.logs' or 'dbfs:/path/to/logs')
             spark: SparkSession instance. If None, will get or create.
+            buffered: If True, log() only queues entries and flush() writes them
+                     to the Delta table in a single append. If False (default),
+                     every log() call is written immediately. Pending entries
+                     are also flushed at interpreter exit.
+            buffer_limit: When buffered, flush automatically once this many
+                         entries are pending.
+            capture_source: If True (default), each entry records the file that
+                           called log(). If False, the stack is not walked per
+                           entry and the source detected at construction is used.
+            async_writes: If True, log() only enqueues entries and a background
+                         thread writes them in batches of up to buffer_limit.
+                         flush() waits for queued entries and re-raises any
+                         background write failure; rows from a failed write are
+                         kept and retried by the next flush(). close() also
+                         stops the thread.
+            clock: Callable returning the timestamp recorded for each entry.
+            user_provider: Optional callable returning the user identity. If None,
+                          the user is auto-detected from Spark or the environment.
 
         Raises:
-            ValueError: If domain or process are empty strings
+            ValueError: If domain or process are empty strings, or buffer_limit < 1
             RuntimeError: If SparkSession cannot be obtained
         """
         if not domain or not process:
             raise ValueError("domain and process must be non-empty strings")
+        if buffer_limit < 1:
+            raise ValueError("buffer_limit must be at least 1")
 
         self.domain = domain
         self.process = process
         self.log_table_path = log_table_path
+        self.buffered = buffered
+        self.buffer_limit = buffer_limit
+        self.capture_source = capture_source
+        self.async_writes = async_writes
+        self._pending: list[tuple] = []
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._table_confirmed = False
+        self._clock = clock
+        self._notebook_path: object = _UNSET
+
+        columns = ", ".join(f"`{field.name}`" for field in self.LOG_SCHEMA.fields)
+        markers = ", ".join("?" for _ in self.LOG_SCHEMA.fields)
+        self._insert_sql = f"INSERT INTO {log_table_path} ({columns}) VALUES ({markers})"
 
         self.spark: SparkSession
         if spark is None:
@@ -81,20 +203,45 @@ class DatabricksLogger:
         else:
             self.spark = spark
 
-        # Auto-detect user at initialization
-        self._user = self._detect_user()
+        # Auto-detect user at initialization unless the caller supplies it
+        self._user = user_provider() if user_provider else self._detect_user()
 
         # Auto-detect source file at initialization (calling file, not this module)
         self._source = self._detect_source()
 
+        # Writes happen on a daemon thread so log() never waits on a Delta commit.
+        # None on the queue tells the thread to stop (see close())
+        self._queue: queue.Queue[Optional[list[tuple]]] = queue.Queue()
+        self._async_error: Optional[RuntimeError] = None
+        self._worker: Optional[threading.Thread] = None
+        # Held while handing rows to the worker, so close() can't stop it in between
+        self._worker_lock = threading.Lock()
+        if self.async_writes:
+            self._worker = threading.Thread(
+                target=self._drain, name="databricks-logger", daemon=True
+            )
+            self._worker.start()
+
+        # Don't lose entries that were buffered but never explicitly closed. Held
+        # weakly, so registering doesn't keep the logger (and its session) alive;
+        # a running async worker does, until close()
+        if self.buffered or self.async_writes:
+            _OPEN_LOGGERS.add(self)
+
     def _detect_user(self) -> str:
         """Auto-detect the Databricks user or runtime identity.
 
         Returns:
             User identifier (Databricks user email, username, or system user)
         """
+        cached = _USER_CACHE.get(self.spark)
+        if cached:
+            return cached
+
         try:
-            return self.spark.sql("SELECT current_user()").collect()[0][0]
+            user = self.spark.sql("SELECT current_user()").collect()[0][0]
+            _USER_CACHE[self.spark] = user
+            return user
         except Exception:
             pass
 
@@ -121,57 +268,45 @@ class DatabricksLogger:
             if notebook_path:
                 return notebook_path
             
-            # Get the call stack
-            stack = inspect.stack()
-            
-            # Get the path of this logging module to skip it
-            this_file = Path(__file__).resolve()
-            
-            # Find the first frame outside this module and standard library
-            for frame_info in stack:
-                frame_path = Path(frame_info.filename).resolve()
-                frame_filename = frame_path.name
-                
-                # Skip frames from this logging module
-                if frame_path == this_file:
+            # Walk frames directly rather than via inspect.stack(), which builds
+            # a FrameInfo (and touches the filesystem) for every frame on the stack
+            # The caller is a few frames up, so give up after _MAX_SOURCE_DEPTH frames
+            # instead of walking deep Spark/framework stacks to the bottom
+            frame: Optional[FrameType] = sys._getframe(1)
+            for _ in range(_MAX_SOURCE_DEPTH):
+                if frame is None:
+                    break
+                filename = frame.f_code.co_filename
+                frame_globals = frame.f_globals
+                frame = frame.f_back
+
+                if _skip_frame(filename):
                     continue
-                
-                # Skip internal Python library frames
-                if "site-packages" in str(frame_path) or "lib/python" in str(frame_path):
-                    continue
-                    
-                # Skip unittest/testing framework frames (but not the test file itself)
-                if "unittest" in str(frame_path) and not frame_filename.startswith("test_"):
-                    continue
-                
+
                 # Handle Databricks notebook command execution pattern
                 # These are dynamically generated filenames like "command-4640576040890880-321306660"
-                if frame_filename.startswith("command-"):
+                if os.path.basename(filename).startswith("command-"):
                     # Try to get a better name from the frame's code context
                     # Check if there's a __file__ in the frame's globals
-                    if frame_info.frame.f_globals.get("__file__"):
+                    if frame_globals.get("__file__"):
                         try:
-                            actual_file = Path(frame_info.frame.f_globals["__file__"]).resolve()
-                            if actual_file != this_file:
-                                try:
-                                    return str(actual_file.relative_to(Path.cwd()))
-                                except (ValueError, RuntimeError):
-                                    return actual_file.name
+                            actual_file = frame_globals["__file__"]
+                            if os.path.abspath(actual_file) != os.path.abspath(_THIS_FILE):
+                                return _relative_source(actual_file)
                         except Exception:
                             pass
-                    
+
                     # If we can't resolve it, try the next frame
                     continue
-                
-                # Try to get relative path for cleaner logging
-                try:
-                    # Try to get relative to current working directory
-                    relative_path = frame_path.relative_to(Path.cwd())
-                    return str(relative_path)
-                except (ValueError, RuntimeError):
-                    # If can't get relative path, use filename only
-                    return frame_path.name
-            
+
+                # The shortened path depends only on the filename, so cache by it.
+                # (Code objects are not a safe key: identical functions defined in
+                # different files compare equal.)
+                source = _SOURCE_CACHE.get(filename)
+                if source is None:
+                    source = _SOURCE_CACHE[filename] = _relative_source(filename)
+                return source
+
             # Fallback if we somehow don't find a suitable frame
             return "unknown_source"
     
@@ -179,6 +314,19 @@ class DatabricksLogger:
             return "unknown_source"
     
     def _get_notebook_path(self) -> Optional[str]:
+        """Return the current notebook path in Databricks, probing only once.
+
+        The notebook path cannot change during a session, so the first probe's
+        result (including a miss) is reused for every later log call.
+
+        Returns:
+            Notebook path if running in a Databricks notebook, None otherwise
+        """
+        if self._notebook_path is _UNSET:
+            self._notebook_path = self._probe_notebook_path()
+        return self._notebook_path  # type: ignore[return-value]
+
+    def _probe_notebook_path(self) -> Optional[str]:
         """Attempt to get the current notebook path in Databricks.
         
         Returns:
@@ -226,63 +374,311 @@ class DatabricksLogger:
 
         Raises:
             ValueError: If step, status, or message are empty
-            RuntimeError: If writing to Delta table fails
+            RuntimeError: If writing to Delta table fails (unbuffered loggers, or
+                         when a buffered logger reaches buffer_limit)
+        """
+        _check_status(status)
+        self._log_unchecked(step, status, message, source_override)
+
+    def _log_unchecked(
+        self,
+        step: str,
+        status: LogStatus,
+        message: str,
+        source_override: Optional[str] = None,
+    ) -> None:
+        """Log an entry whose status is already known to be valid.
+
+        Used by success()/warning()/failure(), which pass a fixed status.
+        """
+        entry = self._build_entry(step, status, message, source_override)
+        self._submit([entry])
+
+    def log_many(
+        self,
+        entries: list[tuple[str, LogStatus, str]],
+        source_override: Optional[str] = None,
+    ) -> None:
+        """Log several entries to the Delta table with a single append.
+
+        Args:
+            entries: (step, status, message) tuples, validated as in log()
+            source_override: Optional override for the source file path,
+                           applied to every entry.
+
+        Raises:
+            ValueError: If any entry has an empty step/message or invalid status
+                       (nothing is logged in that case)
+            RuntimeError: If writing to Delta table fails (unbuffered loggers, or
+                         when a buffered logger reaches buffer_limit)
+        """
+        rows = []
+        for step, status, message in entries:
+            _check_status(status)
+            rows.append(self._build_entry(step, status, message, source_override))
+        if not rows:
+            return
+
+        self._submit(rows)
+
+    def _submit(self, rows: list[tuple]) -> None:
+        """Hand validated rows to the background writer, the buffer, or Delta.
+
+        Args:
+            rows: Rows matching LOG_SCHEMA
+
+        Raises:
+            RuntimeError: If a synchronous write to the Delta table fails
+        """
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(rows)
+                return
+
+        if self.buffered:
+            self._buffer(rows)
+            return
+
+        self._write_entries(rows)
+
+    def _drain(self) -> None:
+        """Background writer loop: write queued rows in batches of up to buffer_limit.
+
+        A failed write's rows are moved to the pending buffer and its error is
+        re-raised by the next flush(), since there is no caller to raise it to here.
+        """
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                return
+
+            batches = [first]
+            rows = list(first)
+            stop = False
+            while len(rows) < self.buffer_limit:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    stop = True
+                    break
+                batches.append(batch)
+                rows.extend(batch)
+
+            try:
+                self._write_entries(rows)
+            except RuntimeError as e:
+                # Keep the rows for the next flush, as a failed buffered flush does
+                with self._pending_lock:
+                    self._pending.extend(rows)
+                self._async_error = e
+            finally:
+                for _ in range(len(batches) + stop):
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _buffer(self, rows: list[tuple]) -> None:
+        """Queue rows for the next flush, flushing now if buffer_limit is reached.
+
+        Args:
+            rows: Rows matching LOG_SCHEMA
+
+        Raises:
+            RuntimeError: If an automatic flush fails to write to the Delta table
+        """
+        with self._pending_lock:
+            self._pending.extend(rows)
+            limit_reached = len(self._pending) >= self.buffer_limit
+
+        if limit_reached:
+            self.flush()
+
+    def _build_entry(
+        self,
+        step: str,
+        status: LogStatus,
+        message: str,
+        source_override: Optional[str],
+    ) -> tuple:
+        """Validate step and message and build a log row matching LOG_SCHEMA.
+
+        The status is validated by the caller (see _check_status).
+
+        Args:
+            step: The action/step in the process being performed
+            status: Status of the operation ('success', 'warning', or 'failure')
+            message: Descriptive log message
+            source_override: Optional override for the source file path
+
+        Returns:
+            Tuple of values in LOG_SCHEMA column order
+
+        Raises:
+            ValueError: If step or message are empty
         """
         if not step or not message:
             raise ValueError("step and message must be non-empty strings")
 
-        if status not in ("success", "warning", "failure"):
-            raise ValueError(f"Invalid status: {status}. Must be success, warning, or failure")
-
-        # Capture current timestamp
-        log_time = datetime.now()
-        log_date = date.today().isoformat()
+        # Capture current timestamp once; deriving the date from it keeps the two
+        # consistent when a log call straddles midnight
+        log_time = self._clock()
+        log_date = log_time.date().isoformat()
 
         # Re-detect source at log time if not overridden
         # This allows capturing the actual calling location
-        source = source_override if source_override else self._detect_source()
-
-        # Create log entry as a DataFrame
-        log_data = [
-            (
-                log_date,
-                log_time,
-                self._user,
-                self.domain,
-                self.process,
-                step,
-                source,
-                status,
-                message,
-            )
-        ]
+        if source_override:
+            source = source_override
+        elif self.capture_source:
+            source = self._detect_source()
+        else:
+            source = self._source
+
+        return (
+            log_date,
+            log_time,
+            self._user,
+            self.domain,
+            self.process,
+            step,
+            source,
+            status,
+            message,
+        )
+
+    def flush(self) -> None:
+        """Write all buffered log entries to the Delta table in a single append.
+
+        Does nothing if no entries are pending. If the write fails, the entries
+        stay pending for the next flush. With async_writes, waits until the
+        background writer has written everything queued so far, then retries
+        the rows of any earlier failed background write.
+
+        Raises:
+            RuntimeError: If writing to Delta table fails (for async_writes, if
+                         any background write failed since the last flush)
+        """
+        if self._worker is not None:
+            self._queue.join()
+            self._raise_async_error()
 
-        log_df = self.spark.createDataFrame(log_data, schema=self.LOG_SCHEMA)
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+
+        if not pending:
+            return
 
-        # Write to Delta table
         try:
-            self._write_to_delta(log_df)
+            self._write_entries(pending)
+        except RuntimeError:
+            # Keep the entries (ahead of any logged meanwhile) for the next flush
+            with self._pending_lock:
+                self._pending[:0] = pending
+            raise
+
+    def close(self) -> None:
+        """Write all pending entries and stop the background writer, if any.
+
+        The logger remains usable: after close(), an async_writes logger writes
+        synchronously (or buffers, if buffered). Called for open loggers at exit.
+
+        Raises:
+            RuntimeError: If writing to Delta table fails
+        """
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is not None:
+                # No rows can be queued behind this once the lock is released
+                self._queue.put(None)
+        if worker is None:
+            self.flush()
+            return
+
+        worker.join()
+        self._raise_async_error()
+        # Entries buffered while the worker was stopping are written now
+        self.flush()
+
+    def _raise_async_error(self) -> None:
+        """Re-raise (once) the last failure from the background writer."""
+        error, self._async_error = self._async_error, None
+        if error is not None:
+            raise error
+
+    def _write_entries(self, entries: list[tuple]) -> None:
+        """Write log entry tuples to the Delta table as one DataFrame.
+
+        A single entry for a table that is already known to exist is written
+        with a parameterized INSERT instead, skipping DataFrame construction.
+
+        The tuples are passed to createDataFrame as-is. Under Databricks Connect
+        the client already converts a local list to a single Arrow batch, so
+        going through pandas first would only add a copy.
+
+        Args:
+            entries: Rows matching LOG_SCHEMA
+
+        Raises:
+            RuntimeError: If writing to Delta table fails
+        """
+        # Serialize writes so concurrent flushes can't both create the table
+        try:
+            with self._write_lock:
+                try:
+                    self._write_rows(entries)
+                except Exception as e:
+                    if not self._table_confirmed or "TABLE_OR_VIEW_NOT_FOUND" not in str(e):
+                        raise
+                    # The table was dropped after this logger confirmed it; recreate it
+                    self._table_confirmed = False
+                    self._write_rows(entries)
         except Exception as e:
             raise RuntimeError(f"Failed to write log to Delta table: {e}") from e
 
+    def _write_rows(self, entries: list[tuple]) -> None:
+        """Write rows by single-row INSERT or via a DataFrame, whichever applies.
+
+        Args:
+            entries: Rows matching LOG_SCHEMA
+        """
+        if len(entries) == 1 and self._table_confirmed:
+            # A single row into an existing table needs no DataFrame
+            self.spark.sql(self._insert_sql, args=list(entries[0]))
+            return
+
+        log_df = self.spark.createDataFrame(entries, schema=self.LOG_SCHEMA)
+        self._write_to_delta(log_df)
 
     def _write_to_delta(self, log_df: DataFrame) -> None:
         """Write log DataFrame to Delta table.
 
         Creates the table if it doesn't exist, otherwise appends to existing table.
+        Once a write has succeeded the table is known to exist, so later writes
+        append without asking the metastore again.
 
         Args:
             log_df: DataFrame containing log entry
         """
-        table_exists = self.spark.catalog.tableExists(self.log_table_path)
-
-        if table_exists:
+        if self._table_confirmed or self.spark.catalog.tableExists(self.log_table_path):
             log_df.write.format("delta").mode("append").saveAsTable(self.log_table_path)
         else:
             log_df.write.format("delta").mode("overwrite").option(
                 "overwriteSchema", "true"
             ).saveAsTable(self.log_table_path)
 
+        self._table_confirmed = True
+
+    def reset_table_cache(self) -> None:
+        """Forget that the log table exists, so the next write checks again.
+
+        Use after the log table has been dropped outside this logger. A write
+        that finds the table missing also resets this automatically.
+        """
+        self._table_confirmed = False
+
     def success(self, step: str, message: str, source_override: Optional[str] = None) -> None:
         """Log a successful operation.
 
@@ -291,7 +687,7 @@ class DatabricksLogger:
             message: Success message
             source_override: Optional override for source file path
         """
-        self.log(step, "success", message, source_override)
+        self._log_unchecked(step, "success", message, source_override)
 
     def warning(self, step: str, message: str, source_override: Optional[str] = None) -> None:
         """Log a warning.
@@ -301,7 +697,7 @@ class DatabricksLogger:
             message: Warning message
             source_override: Optional override for source file path
         """
-        self.log(step, "warning", message, source_override)
+        self._log_unchecked(step, "warning", message, source_override)
 
     def failure(self, step: str, message: str, source_override: Optional[str] = None) -> None:
         """Log a failure.
@@ -311,7 +707,7 @@ class DatabricksLogger:
             message: Failure/error message
             source_override: Optional override for source file path
         """
-        self.log(step, "failure", message, source_override)
+        self._log_unchecked(step, "failure", message, source_override)
 
     def get_logs(
         self,
@@ -334,10 +730,10 @@ class DatabricksLogger:
         try:
             df = self.spark.read.format("delta").table(self.log_table_path)
 
-            # Apply filters if provided
+            # Apply filters as one combined predicate (a single Filter node)
             if filters:
-                for column, value in filters.items():
-                    df = df.filter(df[column] == value)
+                predicate = reduce(and_, (df[column] == value for column, value in filters.items()))
+                df = df.filter(predicate)
 
             # Apply limit if provided
             if limit:
@@ -354,6 +750,12 @@ def create_logger(
     process: str,
     log_table_path: str,
     spark: Optional[SparkSession] = None,
+    buffered: bool = False,
+    buffer_limit: int = 50,
+    capture_source: bool = True,
+    async_writes: bool = False,
+    clock: Callable[[], datetime] = datetime.now,
+    user_provider: Optional[Callable[[], str]] = None,
 ) -> DatabricksLogger:
     """Factory function to create a DatabricksLogger instance.
 
@@ -362,6 +764,12 @@ def create_logger(
         process: Process being executed
         log_table_path: Path to the Delta table for logs
         spark: Optional SparkSession instance
+        buffered: If True, entries are held until flush() is called
+        buffer_limit: Number of buffered entries that triggers an automatic flush
+        capture_source: If False, every entry uses the source detected at creation
+        async_writes: If True, entries are written by a background thread
+        clock: Callable returning the timestamp recorded for each entry
+        user_provider: Optional callable returning the user identity
 
     Returns:
         Configured DatabricksLogger instance
@@ -371,4 +779,10 @@ def create_logger(
         process=process,
         log_table_path=log_table_path,
         spark=spark,
+        buffered=buffered,
+        buffer_limit=buffer_limit,
+        capture_source=capture_source,
+        async_writes=async_writes,
+        clock=clock,
+        user_provider=user_provider,
     )